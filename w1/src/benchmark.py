@@ -0,0 +1,152 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from main import (
+    ProblemMatcher,
+    extract_problem_lines_parallel,
+    external_sort_by_timestamp,
+    read_log_file,
+    sort_lines_by_timestamp,
+    stream_log_file,
+)
+
+SORT_SIZES = [1_000_000, 10_000_000, 100_000_000]
+# 전체 로드 정렬은 줄 수에 비례해 메모리를 쓰므로 (1천만 줄에 수 GB) 이보다 큰 크기는 건너뜀
+# MemoryError 가 나기 전에 OOM killer 가 프로세스를 죽일 수 있어 예외 처리만으로는 부족함
+IN_MEMORY_LIMIT = 10_000_000
+SCAN_SIZE = 10_000_000
+MATCH_LINES = 20_000
+MATCH_PATTERN_COUNTS = [2, 16, 32, 64, 400]
+PROBLEM_MESSAGES = ["oxygen tank unstable.", "oxygen tank explosion."]
+MESSAGES = [
+    "Rocket initialization process started.",
+    "Power systems online. Batteries at optimal charge.",
+    "Oxygen tank unstable.",
+    "Oxygen tank explosion.",
+]
+
+
+def make_log_file(file_path, num_lines):
+    # 벤치마크용 로그 파일 생성 (타임스탬프는 섞인 순서로 기록)
+    with open(file_path, "w") as file:
+        file.write("timestamp,event,message\n")
+        for i in range(num_lines):
+            seconds = (i * 7919) % 86400
+            timestamp = (
+                f"2023-08-27 {seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+            )
+            file.write(f"{timestamp},INFO,{MESSAGES[i % len(MESSAGES)]}\n")
+
+
+def time_in_memory_sort(file_path):
+    # 기존 방식: 전체 로드 후 sorted()
+    start = time.perf_counter()
+    lines = read_log_file(file_path)
+    header, sorted_lines = sort_lines_by_timestamp(lines)
+    for _ in sorted_lines:
+        pass
+    return time.perf_counter() - start
+
+
+def time_external_sort(file_path, max_lines_in_memory):
+    # 외부 정렬: run 파일 + k-way 병합
+    start = time.perf_counter()
+    header, records = stream_log_file(file_path)
+    for _ in external_sort_by_timestamp(records, max_lines_in_memory):
+        pass
+    return time.perf_counter() - start
+
+
+def benchmark_sort(sizes=SORT_SIZES, max_lines_in_memory=1_000_000, in_memory_limit=IN_MEMORY_LIMIT):
+    # 메모리 정렬과 외부 정렬의 소요 시간 비교
+    # in_memory_limit 보다 큰 크기는 외부 정렬만 측정 (None 이면 제한 없음)
+    print(f"{'lines':>12} {'in-memory(s)':>14} {'external(s)':>14}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "bench.log")
+        for size in sizes:
+            make_log_file(file_path, size)
+            if in_memory_limit is not None and size > in_memory_limit:
+                in_memory = f"{'skipped':>14}"
+            else:
+                try:
+                    in_memory = f"{time_in_memory_sort(file_path):14.2f}"
+                except MemoryError:
+                    in_memory = f"{'MemoryError':>14}"
+            external = time_external_sort(file_path, max_lines_in_memory)
+            print(f"{size:>12} {in_memory} {external:14.2f}")
+
+
+def benchmark_parallel(num_lines=SCAN_SIZE, worker_counts=None):
+    # 작업자 수에 따른 병렬 문제 로그 추출 속도 비교
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cpu_count:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cpu_count:
+            worker_counts.append(cpu_count)
+
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "bench.log")
+        make_log_file(file_path, num_lines)
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            extract_problem_lines_parallel(file_path, PROBLEM_MESSAGES, workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:10.2f} {baseline / elapsed:8.2f}")
+
+
+def benchmark_match(num_lines=MATCH_LINES, pattern_counts=MATCH_PATTERN_COUNTS, seed=0):
+    # 문제 메시지 수에 따른 ProblemMatcher.search() 와 단순 반복 비교(in) 의 소요 시간 비교
+    # 로그 줄과 문제 메시지는 같은 단어 집합에서 무작위로 만들어 일부 줄만 일치하게 함
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = ["".join(rng.choices(letters, k=rng.randint(4, 9))) for _ in range(3000)]
+    lines = [
+        f"2023-08-27 10:{i % 60:02d}:00,INFO," + " ".join(rng.choices(words, k=8))
+        for i in range(num_lines)
+    ]
+
+    print(f"{'patterns':>9} {'search(s)':>10} {'loop(s)':>10} {'matched':>8}")
+    for count in pattern_counts:
+        patterns = [" ".join(rng.choices(words, k=2)) for _ in range(count)]
+        matcher = ProblemMatcher(patterns)
+        start = time.perf_counter()
+        matched = sum(1 for line in lines if matcher.search(line))
+        search_time = time.perf_counter() - start
+
+        lowered = [pattern.lower() for pattern in patterns]
+        start = time.perf_counter()
+        for line in lines:
+            text = line.lower()
+            any(pattern in text for pattern in lowered)
+        loop_time = time.perf_counter() - start
+        print(f"{count:>9} {search_time:10.3f} {loop_time:10.3f} {matched:>8}")
+
+
+if __name__ == "__main__":
+    # 사용법: python benchmark.py sort [--in-memory-limit=줄 수] [줄 수 ...]
+    #         python benchmark.py parallel [줄 수]
+    #         python benchmark.py match [줄 수]
+    command = sys.argv[1] if len(sys.argv) > 1 else "sort"
+    in_memory_limit = IN_MEMORY_LIMIT
+    args = []
+    for arg in sys.argv[2:]:
+        if arg.startswith("--in-memory-limit="):
+            in_memory_limit = int(arg.split("=", 1)[1])
+        else:
+            args.append(int(arg))
+    if command == "sort":
+        benchmark_sort(args or SORT_SIZES, in_memory_limit=in_memory_limit)
+    elif command == "parallel":
+        benchmark_parallel(args[0] if args else SCAN_SIZE)
+    elif command == "match":
+        benchmark_match(args[0] if args else MATCH_LINES)
+    else:
+        print(f"알 수 없는 벤치마크입니다: {command}")
@@ -1 +1,105 @@
-print('Hello Mars')
\ No newline at end of file
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+from main import (  # noqa: E402
+    query_log_range,
+    read_log_tail,
+    update_timestamp_index,
+)
+
+HEADER = "timestamp,event,message\n"
+
+
+def make_line(second, message="ok"):
+    return f"2023-08-27 {second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d},INFO,{message}\n"
+
+
+class TimestampIndexTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.log_path = os.path.join(temp_dir.name, "mission_computer_main.log")
+        self.index_path = self.log_path + ".idx"
+        self.lines = []
+
+    def write_log(self, lines, mode="w"):
+        with open(self.log_path, mode) as log_file:
+            if mode == "w":
+                log_file.write(HEADER)
+            log_file.writelines(lines)
+
+    def records(self, lines):
+        return [line.strip().split(",") for line in lines]
+
+    def in_range(self, lines, start_time, end_time):
+        return [record for record in self.records(lines) if start_time <= record[0] <= end_time]
+
+    def test_range_and_tail_on_sorted_log(self):
+        lines = [make_line(second * 3, f"m{second}") for second in range(500)]
+        self.write_log(lines)
+        start_time, end_time = lines[130][:19], lines[270][:19]
+        header, records = query_log_range(self.log_path, start_time, end_time)
+        self.assertEqual(header, ["timestamp", "event", "message"])
+        self.assertEqual(list(records), self.in_range(lines, start_time, end_time))
+        self.assertEqual(read_log_tail(self.log_path, 7)[1], self.records(lines[-7:]))
+        self.assertTrue(os.path.exists(self.index_path))
+
+    def test_appends_are_indexed_incrementally(self):
+        lines = [make_line(second) for second in range(100)]
+        self.write_log(lines)
+        self.assertEqual(update_timestamp_index(self.log_path)["lines"], 100)
+
+        # 줄바꿈이 없는 마지막 줄은 아직 기록 중이므로 색인하지 않음
+        more = [make_line(second) for second in range(100, 200)]
+        self.write_log(more + ["2023-08-27 01:00:00,INFO,partial"], mode="a")
+        index = update_timestamp_index(self.log_path)
+        self.assertEqual(index["lines"], 200)
+        self.assertTrue(index["sorted"])
+        self.assertEqual(read_log_tail(self.log_path, 3)[1], self.records(more[-3:]))
+
+        self.write_log(["\n"], mode="a")
+        self.assertEqual(update_timestamp_index(self.log_path)["lines"], 201)
+
+    def test_unsorted_log_is_scanned(self):
+        seconds = list(range(300))
+        random.Random(4).shuffle(seconds)
+        lines = [make_line(second) for second in seconds]
+        self.write_log(lines)
+        self.assertFalse(update_timestamp_index(self.log_path)["sorted"])
+        start_time, end_time = make_line(40)[:19], make_line(90)[:19]
+        self.assertEqual(
+            list(query_log_range(self.log_path, start_time, end_time)[1]),
+            self.in_range(lines, start_time, end_time),
+        )
+
+    def test_replaced_log_is_reindexed(self):
+        self.write_log([make_line(second, "old") for second in range(100)])
+        update_timestamp_index(self.log_path)
+
+        # 더 큰 다른 파일로 교체되면 예전 오프셋과 줄 수를 쓰지 않음
+        lines = [make_line(second * 2, "new") for second in range(150)]
+        temp_path = self.log_path + ".new"
+        with open(temp_path, "w") as log_file:
+            log_file.write(HEADER)
+            log_file.writelines(lines)
+        os.replace(temp_path, self.log_path)
+        self.assertEqual(update_timestamp_index(self.log_path)["lines"], 150)
+        self.assertEqual(read_log_tail(self.log_path, 2)[1], self.records(lines[-2:]))
+
+    def test_query_works_when_index_cannot_be_saved(self):
+        lines = [make_line(second) for second in range(100)]
+        self.write_log(lines)
+        # 임시 파일 자리에 디렉터리가 있으면 인덱스 저장이 OSError 로 실패함
+        os.mkdir(self.index_path + ".tmp")
+        self.assertEqual(read_log_tail(self.log_path, 2)[1], self.records(lines[-2:]))
+        self.assertFalse(os.path.exists(self.index_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
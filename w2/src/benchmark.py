@@ -0,0 +1,212 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from main import (
+    InventoryBinaryV1,
+    InventoryTable,
+    consolidate_inventories,
+    read_csv_file,
+    read_csv_typed,
+    save_to_binary,
+)
+
+INPUT_FILE = "./w2/data/raw/Mars_Base_Inventory_List.csv"
+TABLE_ROWS = 10_000_000
+BINARY_SIZE_MB = 2048
+CSV_ROWS = 1_000_000
+CONSOLIDATE_FILES = 8
+CONSOLIDATE_ROWS = 200_000
+
+
+def make_rows(data, num_rows):
+    # 원본 데이터를 반복해서 num_rows 행을 만듦 (파일에서 읽은 것처럼 문자열은 매번 새로 생성)
+    return [
+        [value.encode("utf-8").decode("utf-8") for value in data[i % len(data)]]
+        for i in range(num_rows)
+    ]
+
+
+def measure(builder):
+    # builder 가 만든 객체가 차지하는 메모리(바이트)와 소요 시간을 측정
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = builder()
+    elapsed = time.perf_counter() - start
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, used, elapsed
+
+
+def benchmark_table(num_rows=TABLE_ROWS):
+    # 행 리스트와 열 단위 표의 메모리 사용량과 정렬/필터 시간을 비교
+    header, data = read_csv_file(INPUT_FILE)
+    if header is None:
+        return
+
+    rows, rows_bytes, _ = measure(lambda: make_rows(data, num_rows))
+    table, table_bytes, build_time = measure(lambda: InventoryTable.from_rows(header, rows))
+    print(f"행 수: {num_rows}")
+    print(f"행 리스트 메모리: {rows_bytes / 1024 / 1024:.1f} MB")
+    print(f"열 단위 표 메모리: {table_bytes / 1024 / 1024:.1f} MB (변환 {build_time:.2f}초)")
+
+    start = time.perf_counter()
+    sorted(rows, key=lambda x: float(x[-1]), reverse=True)
+    [item for item in rows if float(item[-1]) >= 0.7]
+    print(f"행 리스트 정렬+필터: {time.perf_counter() - start:.2f}초")
+
+    start = time.perf_counter()
+    order = table.argsort_by_flammability()
+    table.select_by_flammability(0.7, order)
+    print(f"열 단위 표 정렬+필터: {time.perf_counter() - start:.2f}초")
+
+
+def make_binary_file(binary_file, data, size_mb):
+    # 원본 데이터를 반복해서 약 size_mb 크기의 기존 형식 이진 파일을 만듦
+    row_bytes = sum(len(",".join(item)) + 4 for item in data) / len(data)
+    num_rows = int(size_mb * 1024 * 1024 / row_bytes)
+    save_to_binary((data[i % len(data)] for i in range(num_rows)), binary_file)
+    return num_rows
+
+
+def read_binary_file_io(binary_file):
+    # 기존 read_from_binary 와 같은 방식(행마다 read 두 번 + 디코드)으로 읽음
+    count = 0
+    with open(binary_file, "rb") as file:
+        while True:
+            length_data = file.read(4)
+            if not length_data:
+                break
+            length = int.from_bytes(length_data, byteorder="big")
+            file.read(length).decode("utf-8")
+            count += 1
+    return count
+
+
+def benchmark_binary_reader(size_mb=BINARY_SIZE_MB):
+    # 파일 read 방식과 mmap 리더의 처리량 비교
+    header, data = read_csv_file(INPUT_FILE)
+    if header is None:
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        binary_file = os.path.join(temp_dir, "bench.bin")
+        make_binary_file(binary_file, data, size_mb)
+        file_mb = os.path.getsize(binary_file) / 1024 / 1024
+
+        def run(name, reader):
+            start = time.perf_counter()
+            reader()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<28} {elapsed:8.2f}초 {file_mb / elapsed:10.1f} MB/s")
+
+        run("read + decode (기존)", lambda: read_binary_file_io(binary_file))
+        with InventoryBinaryV1(binary_file) as reader:
+            run("mmap memoryview", lambda: sum(1 for _ in reader))
+            run("mmap count", reader.count)
+            run("mmap + decode", lambda: sum(1 for _ in reader.records()))
+            run("mmap 인화성 지수만", lambda: sum(reader.iter_flammability()))
+
+
+def read_csv_split(file_path):
+    # 예전 read_csv_file 방식: readlines() 후 쉼표로 직접 나누고 인화성 지수를 float 로 변환
+    with open(file_path, "r") as file:
+        lines = file.readlines()
+        header = lines[0].strip().split(",")
+        data = [line.strip().split(",") for line in lines[1:]]
+    for item in data:
+        float(item[-1])
+    return header, data
+
+
+def read_csv_typed_chunks(file_path):
+    # 타입 추론 CSV 엔진으로 행 묶음을 차례로 읽음 (전체를 한 리스트로 모으지 않음)
+    header, types, chunks = read_csv_typed(file_path)
+    return sum(len(chunk) for chunk in chunks)
+
+
+def benchmark_csv(num_rows=CSV_ROWS):
+    # CSV 읽기 경로별 처리 시간 비교
+    header, data = read_csv_file(INPUT_FILE)
+    if header is None:
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_file = os.path.join(temp_dir, "bench.csv")
+        with open(csv_file, "w") as file:
+            file.write(",".join(header) + "\n")
+            for i in range(num_rows):
+                file.write(",".join(data[i % len(data)]) + "\n")
+        file_mb = os.path.getsize(csv_file) / 1024 / 1024
+
+        baseline = None
+        for name, reader in [
+            ("readlines + split (기존)", read_csv_split),
+            ("csv.reader 문자열", read_csv_file),
+            ("csv.reader + 타입 추론", read_csv_typed_chunks),
+        ]:
+            start = time.perf_counter()
+            reader(csv_file)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"{name:<26} {elapsed:8.2f}초 {file_mb / elapsed:8.1f} MB/s "
+                f"x{baseline / elapsed:.2f}"
+            )
+
+
+def benchmark_consolidate(rows_per_file=CONSOLIDATE_ROWS, num_files=CONSOLIDATE_FILES, worker_counts=None):
+    # 작업자 수에 따른 여러 인벤토리 병합(consolidate_inventories) 소요 시간 비교
+    header, data = read_csv_file(INPUT_FILE)
+    if header is None:
+        return
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cpu_count:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cpu_count:
+            worker_counts.append(cpu_count)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_files = []
+        for number in range(num_files):
+            csv_file = os.path.join(temp_dir, f"module{number}.csv")
+            with open(csv_file, "w") as file:
+                file.write(",".join(header) + "\n")
+                for i in range(rows_per_file):
+                    file.write(",".join(data[(i + number) % len(data)]) + "\n")
+            input_files.append(csv_file)
+        binary_file = os.path.join(temp_dir, "merged.bin")
+        danger_file = os.path.join(temp_dir, "danger.csv")
+
+        print(f"파일 {num_files}개 x {rows_per_file}행")
+        print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            consolidate_inventories(input_files, binary_file, danger_file, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:10.2f} {baseline / elapsed:8.2f}")
+
+
+if __name__ == "__main__":
+    # 사용법: python w2/src/benchmark.py table [행 수]
+    #         python w2/src/benchmark.py binary [MB]
+    #         python w2/src/benchmark.py csv [행 수]
+    #         python w2/src/benchmark.py consolidate [파일당 행 수] [파일 수]
+    command = sys.argv[1] if len(sys.argv) > 1 else "table"
+    args = [int(arg) for arg in sys.argv[2:]]
+    if command == "table":
+        benchmark_table(args[0] if args else TABLE_ROWS)
+    elif command == "binary":
+        benchmark_binary_reader(args[0] if args else BINARY_SIZE_MB)
+    elif command == "csv":
+        benchmark_csv(args[0] if args else CSV_ROWS)
+    elif command == "consolidate":
+        benchmark_consolidate(*args[:2])
+    else:
+        print(f"알 수 없는 벤치마크입니다: {command}")
@@ -1,11 +1,71 @@
+import csv
+import glob
+import heapq
+import io
+import itertools
+import mmap
+import os
+import struct
+import sys
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+# 고정된 파일 경로 설정
+INPUT_FILE = "./w2/data/raw/Mars_Base_Inventory_List.csv"
+DANGER_FILE = "./w2/data/processed/Mars_Base_Inventory_danger.csv"
+BINARY_FILE = "./w2/data/processed/Mars_Base_Inventory_List.bin"
+
+# 이진 파일 v2 형식
+# [헤더 24바이트: 매직, 버전, 플래그, 열 수, 행 수, 오프셋 표 위치]
+# [열 이름: 4바이트 길이 + CSV 한 줄로 인코딩한 UTF-8 문자열]
+# [인화성 지수 열: 행 수 x 8바이트 double]
+# [각 행을 CSV 한 줄(따옴표 규칙 포함)로 인코딩한 UTF-8 문자열을 이어 붙인 영역]
+# [오프셋 표: (행 수 + 1) x 8바이트, 각 행 문자열의 시작 위치와 마지막 끝 위치]
+BINARY_MAGIC = b"MBIN"
+BINARY_VERSION = 2
+BINARY_FLAG_SORTED_DESC = 0x01
+_V2_HEADER = struct.Struct(">4sBBHQQ")
+_V2_LENGTH = struct.Struct(">I")
+_V2_FLOAT = struct.Struct(">d")
+_V2_OFFSET = struct.Struct(">Q")
+
+# 숫자 열에서 값이 없는 것으로 취급할 문자열 (소문자로 비교)
+MISSING_VALUES = frozenset({"", "various", "n/a", "na", "none", "unknown", "-"})
+CSV_CHUNK_ROWS = 65536
+CSV_BUFFER_SIZE = 1024 * 1024
+CSV_CACHE_SIZE = 65536
+
+
+def _encode_record(item):
+    # 행을 CSV 한 줄로 인코딩, 쉼표나 따옴표가 든 필드가 없으면 그냥 쉼표로 이어 붙임
+    if not any("," in value or '"' in value or "\n" in value or "\r" in value for value in item):
+        return ",".join(item)
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow(item)
+    return buffer.getvalue()
+
+
+def _decode_record(text):
+    # _encode_record 로 만든 한 줄을 다시 필드 리스트로 변환 (따옴표가 없으면 split 으로 빠르게)
+    if '"' not in text:
+        return text.split(",")
+    return next(csv.reader([text]))
+
+
 def read_csv_file(file_path):
     # 주어진 파일 경로에서 CSV 파일을 읽어 헤더와 데이터를 반환
+    # 따옴표로 감싼 필드(RFC 4180)도 처리할 수 있도록 csv 모듈 사용
     try:
-        with open(file_path, "r") as file:
-            lines = file.readlines()
-            header = lines[0].strip().split(",")
-            data = [line.strip().split(",") for line in lines[1:]]
+        with open(file_path, "r", newline="") as file:
+            reader = csv.reader(file)
+            header = next(reader)
+            data = [row for row in reader if row]
             return header, data
+    except StopIteration:
+        print("CSV 파일이 비어 있습니다.")
+        return None, None
     except FileNotFoundError:
         print("파일을 찾을 수 없습니다.")
         return None, None
@@ -17,6 +77,141 @@ def read_csv_file(file_path):
         return None, None
 
 
+def infer_column_types(rows, num_columns):
+    # 표본 행들로 열마다 float 또는 str 타입을 한 번만 결정
+    # 결측값 표시(Various 등)를 뺀 값이 모두 숫자이고 하나 이상 있으면 float 열
+    # 열 수가 헤더와 다른 행은 어느 열의 값인지 알 수 없으므로 추론에서 뺌
+    rows = [row for row in rows if len(row) == num_columns]
+    types = []
+    for index in range(num_columns):
+        has_number = False
+        is_number = True
+        for row in rows:
+            value = row[index].strip()
+            if value.lower() in MISSING_VALUES:
+                continue
+            try:
+                float(value)
+            except ValueError:
+                is_number = False
+                break
+            has_number = True
+        types.append(float if is_number and has_number else str)
+    return types
+
+
+_NOT_A_NUMBER = object()  # 숫자 열에서 결측값 표시도 숫자도 아닌 값 (변환 후 None)
+
+
+def _to_number(value):
+    # 숫자 열 값 변환, 결측값 표시는 None, 숫자가 아닌 값은 _NOT_A_NUMBER
+    if value.strip().lower() in MISSING_VALUES:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return _NOT_A_NUMBER
+
+
+def _fit_row(item, num_columns, row_number):
+    # 열 수가 헤더와 다른 행을 맞춤 (read_csv_typed 와 InventoryTable.from_rows 가 같은 규칙 사용)
+    # 열이 모자라면 마지막 필드(인화성 지수) 앞을 빈 문자열로 채우고,
+    # 열이 헤더보다 많거나 빈 행이면 데이터를 버리지 않도록 ValueError 발생
+    if len(item) > num_columns or not item:
+        raise ValueError(f"{row_number}번째 행의 열 수({len(item)})가 헤더({num_columns})와 맞지 않습니다.")
+    return item[:-1] + [""] * (num_columns - len(item)) + item[-1:]
+
+
+def _convert_chunk(rows, numeric_columns, caches, coerced, padded, first_row_number):
+    # 숫자 열 값만 제자리에서 변환, 이미 본 문자열은 열별 캐시에서 바로 꺼냄
+    # 숫자가 아닌 값은 None 으로 바꾸고 coerced[열 번호] = [개수, 첫 값] 에 기록
+    # 열이 모자라 채운 행은 padded = [개수, 첫 행 번호] 에 기록
+    num_columns = len(caches)
+    for row_number, row in enumerate(rows, start=first_row_number):
+        if len(row) != num_columns:
+            row[:] = _fit_row(row, num_columns, row_number)
+            if not padded[0]:
+                padded[1] = row_number
+            padded[0] += 1
+        for index in numeric_columns:
+            value = row[index]
+            cache = caches[index]
+            try:
+                number = cache[value]
+            except KeyError:
+                if len(cache) >= CSV_CACHE_SIZE:
+                    cache.clear()
+                number = cache[value] = _to_number(value)
+            if number is _NOT_A_NUMBER:
+                coerced.setdefault(index, [0, value])[0] += 1
+                number = None
+            row[index] = number
+    return rows
+
+
+def _iter_typed_chunks(file, reader, header, types, first_rows, chunk_rows):
+    # 표본 행부터 시작해서 chunk_rows 개씩 타입 변환된 행 묶음을 내보냄
+    # 열이 헤더보다 많은 행을 만나면 ValueError 발생 (_fit_row 참고)
+    numeric_columns = [index for index, column_type in enumerate(types) if column_type is float]
+    caches = [{} for _ in types]
+    coerced = {}
+    padded = [0, None]
+    row_number = 1
+    rows = itertools.chain(first_rows, reader)
+    try:
+        with file:
+            while True:
+                chunk = [row for row in itertools.islice(rows, chunk_rows) if row]
+                _convert_chunk(chunk, numeric_columns, caches, coerced, padded, row_number)
+                if not chunk:
+                    return
+                row_number += len(chunk)
+                yield chunk
+    finally:
+        # 표본 이후에 나타난 숫자가 아닌 값과 열이 모자란 행을 조용히 넘기지 않고 알림
+        if padded[0]:
+            print(f"열이 모자란 행 {padded[0]}개(처음: {padded[1]}번째 행)의 마지막 필드 앞을 빈 값으로 채웠습니다.")
+        for index, (count, example) in sorted(coerced.items()):
+            print(f"{header[index]} 열에서 숫자가 아닌 값 {count}개(예: {example!r})를 None 으로 처리했습니다.")
+
+
+def read_csv_typed(file_path, chunk_rows=CSV_CHUNK_ROWS, sample_rows=1000):
+    # 큰 버퍼로 CSV 를 읽어 헤더, 열 타입, 타입이 변환된 행 묶음 제너레이터를 반환
+    # 열 타입은 앞부분 sample_rows 행으로 한 번만 추론하고, 숫자 열의 결측값은 None
+    try:
+        file = open(file_path, "r", newline="", buffering=CSV_BUFFER_SIZE)
+    except FileNotFoundError:
+        print("파일을 찾을 수 없습니다.")
+        return None, None, None
+    except PermissionError:
+        print("파일을 읽을 권한이 없습니다.")
+        return None, None, None
+    except Exception as e:
+        print(f"예상치 못한 오류가 발생했습니다: {e}")
+        return None, None, None
+
+    # 여기서 실패하면 파일을 바로 닫고, 성공하면 행 묶음 제너레이터가 끝날 때 닫음
+    try:
+        reader = csv.reader(file)
+        header = next(reader)
+        first_rows = []
+        for row in reader:
+            first_rows.append(row)
+            if len(first_rows) >= sample_rows:
+                break
+        types = infer_column_types(first_rows, len(header))
+        chunks = _iter_typed_chunks(file, reader, header, types, first_rows, chunk_rows)
+        return header, types, chunks
+    except StopIteration:
+        file.close()
+        print("CSV 파일이 비어 있습니다.")
+        return None, None, None
+    except Exception as e:
+        file.close()
+        print(f"예상치 못한 오류가 발생했습니다: {e}")
+        return None, None, None
+
+
 def sort_by_flammability(data):
     # 데이터 리스트를 마지막 열(인화성 지수)을 기준으로 내림차순 정렬
     try:
@@ -26,6 +221,72 @@ def sort_by_flammability(data):
         return None
 
 
+class InventoryTable:
+    # 인벤토리를 열 단위로 저장하는 표
+    # 문자열 열은 sys.intern 으로 같은 값을 공유하고, 인화성 지수는 한 번만 float 로 변환해 array('d') 에 보관
+
+    def __init__(self, header, columns, flammability):
+        self.header = header
+        self.columns = columns
+        self.flammability = flammability
+
+    @classmethod
+    def from_rows(cls, header, data):
+        # 행 리스트를 열 단위 표로 변환
+        # 열 수가 다른 행은 _fit_row 규칙으로 맞추고, 인화성 지수가 숫자가 아니면 ValueError 발생
+        num_columns = len(header)
+        columns = [[] for _ in header]
+        flammability = array("d")
+        intern = sys.intern
+        for index, item in enumerate(data, start=1):
+            if len(item) != num_columns:
+                item = _fit_row(item, num_columns, index)
+            try:
+                flammability.append(float(item[-1]))
+            except ValueError:
+                raise ValueError("인화성 지수를 숫자로 변환할 수 없습니다.") from None
+            for column, value in zip(columns, item):
+                column.append(intern(value))
+        return cls(header, columns, flammability)
+
+    def __len__(self):
+        return len(self.flammability)
+
+    def row(self, index):
+        # index 번째 행을 원래 문자열 리스트 형태로 반환
+        return [column[index] for column in self.columns]
+
+    def rows(self, indexes=None):
+        # 주어진 순서(기본은 저장 순서)대로 행 리스트를 만들어 반환
+        if indexes is None:
+            indexes = range(len(self))
+        return [self.row(index) for index in indexes]
+
+    def argsort_by_flammability(self, reverse=True):
+        # 인화성 지수 기준 정렬 순서(행 번호 목록)를 반환, 기본은 내림차순
+        return sorted(
+            range(len(self.flammability)),
+            key=self.flammability.__getitem__,
+            reverse=reverse,
+        )
+
+    def select_by_flammability(self, threshold=0.7, indexes=None):
+        # 인화성 지수가 threshold 이상인 행 번호를 indexes 순서를 유지한 채 반환
+        flammability = self.flammability
+        if indexes is None:
+            return [i for i, value in enumerate(flammability) if value >= threshold]
+        return [i for i in indexes if flammability[i] >= threshold]
+
+
+def to_inventory_table(header, data):
+    # 헤더와 데이터로 InventoryTable 을 만듦
+    try:
+        return InventoryTable.from_rows(header, data)
+    except ValueError as e:
+        print(e)
+        return None
+
+
 def print_inventory(header, data):
     # 헤더와 데이터를 콘솔에 출력
     print(",".join(header))
@@ -42,16 +303,96 @@ def extract_high_flammability(data, threshold=0.7):
         return None
 
 
-def save_to_csv(header, data, output_file):
-    # 헤더와 데이터를 지정된 output_file에 CSV 형식으로 저장
+def _iter_csv_rows(file, reader):
+    # 열린 CSV 파일에서 한 줄씩 행을 내보냄
+    with file:
+        for row in reader:
+            if row:
+                yield row
+
+
+def _iter_binary_rows(binary_file):
+    # 이진 파일(기존/v2)의 행을 차례로 내보냄
+    if is_binary_v2(binary_file):
+        with InventoryBinaryV2(binary_file) as reader:
+            yield from reader.records()
+    else:
+        with InventoryBinaryV1(binary_file) as reader:
+            yield from reader.records()
+
+
+def stream_inventory(file_path, header=None):
+    # 파일 전체를 읽지 않고 헤더와 행 제너레이터를 반환
+    # .bin 파일은 이진 형식으로 읽으며, 헤더가 없는 기존 형식이면 인자로 받은 header 를 그대로 반환
     try:
-        with open(output_file, "w") as file:
-            file.write(",".join(header) + "\n")
-            for item in data:
-                file.write(",".join(item) + "\n")
-        print(f"인화성 지수가 0.7 이상인 항목을 {output_file} 파일에 저장했습니다.")
+        if file_path.lower().endswith(".bin"):
+            if is_binary_v2(file_path):
+                with InventoryBinaryV2(file_path) as reader:
+                    header = reader.header
+            return header, _iter_binary_rows(file_path)
+
+        file = open(file_path, "r", newline="")
+        reader = csv.reader(file)
+        header = next(reader, None)
+        return header, _iter_csv_rows(file, reader)
+    except FileNotFoundError:
+        print("파일을 찾을 수 없습니다.")
+        return None, None
+    except PermissionError:
+        print("파일을 읽을 권한이 없습니다.")
+        return None, None
+    except Exception as e:
+        print(f"예상치 못한 오류가 발생했습니다: {e}")
+        return None, None
+
+
+def top_k_by_flammability(data, k):
+    # 전체 정렬 없이 크기 k 의 힙으로 인화성 지수 상위 k 개를 내림차순으로 반환
+    try:
+        return heapq.nlargest(k, data, key=lambda x: float(x[-1]))
+    except ValueError:
+        print("인화성 지수를 숫자로 변환할 수 없습니다.")
+        return None
+
+
+def filter_by_flammability(data, threshold=0.7):
+    # 한 번 훑으면서 인화성 지수가 threshold 이상인 행을 바로 내보냄 (입력 순서 유지)
+    # 제너레이터라 None 을 돌려줄 수 없으므로 숫자가 아닌 인화성 지수를 만나면 ValueError 발생
+    # (save_to_csv 가 이 오류를 받아 출력 파일을 그대로 둠)
+    for item in data:
+        try:
+            flammability = float(item[-1])
+        except ValueError:
+            raise ValueError("인화성 지수를 숫자로 변환할 수 없습니다.") from None
+        if flammability >= threshold:
+            yield item
+
+
+def save_to_csv(header, data, output_file, description="인화성 지수가 0.7 이상인 항목"):
+    # 헤더와 데이터를 지정된 output_file에 CSV 형식으로 저장 (data 는 리스트나 제너레이터)
+    # header 가 None 이면(헤더 없는 이진 파일에서 읽은 경우) 헤더 줄 없이 저장
+    # 임시 파일에 다 쓴 뒤 교체하므로 제너레이터가 중간에 실패해도 기존 파일은 그대로 남음
+    # 저장에 성공하면 True, 실패하면 False 반환
+    if data is None:
+        print("저장할 데이터가 없습니다.")
+        return False
+    temp_path = output_file + ".tmp"
+    try:
+        with open(temp_path, "w", newline="") as file:
+            writer = csv.writer(file, lineterminator="\n")
+            if header is not None:
+                writer.writerow(header)
+            writer.writerows(data)
+        os.replace(temp_path, output_file)
     except Exception as e:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
         print(f"파일 저장 중 오류가 발생했습니다: {e}")
+        return False
+    print(f"{description}을 {output_file} 파일에 저장했습니다.")
+    return True
 
 
 def save_to_binary(data, binary_file):
@@ -59,7 +400,7 @@ def save_to_binary(data, binary_file):
     try:
         with open(binary_file, "wb") as file:
             for item in data:
-                line = ",".join(item).encode("utf-8")
+                line = _encode_record(item).encode("utf-8")
                 length = len(line)
                 file.write(length.to_bytes(4, byteorder="big"))
                 file.write(line)
@@ -68,9 +409,249 @@ def save_to_binary(data, binary_file):
         print(f"이진 파일 저장 중 오류가 발생했습니다: {e}")
 
 
+def save_to_binary_v2(header, data, binary_file):
+    # 데이터를 v2 이진 형식으로 저장 (행 번호, 인화성 지수 범위로 바로 찾아갈 수 있는 형식)
+    try:
+        flammability = [float(item[-1]) for item in data]
+        is_sorted = all(a >= b for a, b in zip(flammability, flammability[1:]))
+        header_bytes = _encode_record(header).encode("utf-8")
+
+        with open(binary_file, "wb") as file:
+            # 오프셋 표 위치는 데이터를 다 쓴 뒤에 채움
+            file.write(b"\0" * _V2_HEADER.size)
+            file.write(_V2_LENGTH.pack(len(header_bytes)))
+            file.write(header_bytes)
+            file.write(b"".join(_V2_FLOAT.pack(value) for value in flammability))
+
+            offsets = [file.tell()]
+            for item in data:
+                file.write(_encode_record(item).encode("utf-8"))
+                offsets.append(file.tell())
+
+            footer_offset = file.tell()
+            file.write(b"".join(_V2_OFFSET.pack(offset) for offset in offsets))
+            file.seek(0)
+            file.write(
+                _V2_HEADER.pack(
+                    BINARY_MAGIC,
+                    BINARY_VERSION,
+                    BINARY_FLAG_SORTED_DESC if is_sorted else 0,
+                    len(header),
+                    len(data),
+                    footer_offset,
+                )
+            )
+        print(f"정렬된 데이터를 {binary_file} 파일에 v2 형식으로 저장했습니다.")
+    except ValueError:
+        print("인화성 지수를 숫자로 변환할 수 없습니다.")
+    except Exception as e:
+        print(f"이진 파일 저장 중 오류가 발생했습니다: {e}")
+
+
+def is_binary_v2(binary_file):
+    # 파일 앞부분의 매직 값으로 v2 형식인지 확인 (기존 형식은 4바이트 길이로 시작)
+    with open(binary_file, "rb") as file:
+        return file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+class InventoryBinaryV2:
+    # v2 이진 파일을 mmap 으로 열어 행 번호나 인화성 지수 범위로 바로 접근하는 리더
+
+    def __init__(self, binary_file):
+        self._file = open(binary_file, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, flags, _, rows, footer_offset = _V2_HEADER.unpack_from(
+                self._map, 0
+            )
+            if magic != BINARY_MAGIC:
+                raise ValueError("v2 이진 파일이 아닙니다.")
+            if version != BINARY_VERSION:
+                raise ValueError(f"지원하지 않는 이진 파일 버전입니다: {version}")
+        except Exception:
+            self.close()
+            raise
+
+        header_length = _V2_LENGTH.unpack_from(self._map, _V2_HEADER.size)[0]
+        header_start = _V2_HEADER.size + _V2_LENGTH.size
+        header_end = header_start + header_length
+        self.header = _decode_record(self._map[header_start:header_end].decode("utf-8"))
+        self.is_sorted = bool(flags & BINARY_FLAG_SORTED_DESC)
+        self._rows = rows
+        self._flammability_offset = header_end
+        self._footer_offset = footer_offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __len__(self):
+        return self._rows
+
+    def _check_index(self, index):
+        if not 0 <= index < self._rows:
+            raise IndexError(f"행 번호가 범위를 벗어났습니다: {index}")
+
+    def flammability(self, index):
+        # index 번째 행의 인화성 지수 (O(1))
+        self._check_index(index)
+        return _V2_FLOAT.unpack_from(
+            self._map, self._flammability_offset + index * _V2_FLOAT.size
+        )[0]
+
+    def record(self, index):
+        # index 번째 행을 문자열 리스트로 반환 (O(1))
+        self._check_index(index)
+        start, end = struct.unpack_from(
+            ">2Q", self._map, self._footer_offset + index * _V2_OFFSET.size
+        )
+        return _decode_record(self._map[start:end].decode("utf-8"))
+
+    def records(self, indexes=None):
+        # 주어진 행 번호들(기본은 전체)의 행을 차례로 내보냄
+        if indexes is None:
+            indexes = range(self._rows)
+        for index in indexes:
+            yield self.record(index)
+
+    def _first_below(self, value, inclusive):
+        # 내림차순 정렬된 인화성 지수 열에서 value 보다 작아지는(inclusive 면 value 이하) 첫 위치
+        low, high = 0, self._rows
+        while low < high:
+            middle = (low + high) // 2
+            current = self.flammability(middle)
+            if current > value or (not inclusive and current == value):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find_flammability_range(self, low, high=float("inf")):
+        # 인화성 지수가 low 이상 high 이하인 행 번호 목록
+        # 내림차순으로 저장된 파일이면 이진 탐색(O(log n)), 아니면 전체를 훑음
+        if self.is_sorted:
+            start = self._first_below(high, inclusive=True)
+            end = self._first_below(low, inclusive=False)
+            return range(start, max(start, end))
+        return [
+            index
+            for index in range(self._rows)
+            if low <= self.flammability(index) <= high
+        ]
+
+
+class InventoryBinaryV1:
+    # 기존(4바이트 길이 + 문자열) 이진 파일을 mmap 으로 열어 복사 없이 읽는 리더
+    # 행은 memoryview 조각으로 내보내고, 문자열 변환은 필요할 때만 함
+
+    def __init__(self, binary_file):
+        self._file = open(binary_file, "rb")
+        self._map = None
+        # 아직 끝나지 않은 __iter__ 제너레이터 (memoryview 가 남아 있으면 mmap 을 닫을 수 없음)
+        self._iterators = weakref.WeakSet()
+        try:
+            if os.fstat(self._file.fileno()).st_size:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._size = len(self._map) if self._map is not None else 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        # 멈춰 있는 __iter__ 제너레이터를 먼저 닫아 memoryview 를 해제한 뒤 mmap 을 닫음
+        for iterator in list(self._iterators):
+            iterator.close()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _spans(self):
+        # 각 행 문자열의 (시작, 끝) 위치를 차례로 내보냄
+        unpack_from = _V2_LENGTH.unpack_from
+        data = self._map
+        size = self._size
+        offset = 0
+        while offset + 4 <= size:
+            start = offset + 4
+            offset = start + unpack_from(data, offset)[0]
+            if offset > size:
+                raise ValueError("이진 파일이 중간에 잘려 있습니다.")
+            yield start, offset
+
+    def __iter__(self):
+        # 행을 memoryview 조각으로 내보냄, 조각은 다음 행으로 넘어가거나 close() 하면 해제되므로
+        # 필요하면 복사해서 보관
+        iterator = self._iter_views()
+        self._iterators.add(iterator)
+        return iterator
+
+    def _iter_views(self):
+        if self._map is None:
+            return
+        record = None
+        with memoryview(self._map) as view:
+            try:
+                for start, end in self._spans():
+                    if record is not None:
+                        record.release()
+                    record = view[start:end]
+                    yield record
+            finally:
+                if record is not None:
+                    record.release()
+
+    def records(self):
+        # 행을 문자열 리스트로 변환해서 내보냄
+        data = self._map
+        for start, end in self._spans():
+            yield _decode_record(data[start:end].decode("utf-8"))
+
+    def count(self):
+        # 문자열 변환 없이 길이만 따라가며 행 수를 셈
+        if self._map is None:
+            return 0
+        count = 0
+        for _ in self._spans():
+            count += 1
+        return count
+
+    def iter_flammability(self):
+        # 각 행의 마지막 필드(인화성 지수)만 float 로 읽음 (쉼표가 없는 행은 행 전체를 읽음)
+        # 행 전체를 디코드하고 나누지 않을 뿐 속도는 read() + float 반복과 거의 같음
+        if self._map is None:
+            return
+        data = self._map
+        rfind = data.rfind
+        for start, end in self._spans():
+            comma = rfind(b",", start, end)
+            yield float(data[(comma + 1 if comma != -1 else start):end])
+
+
 def read_from_binary(binary_file):
-    # 이진 파일에서 데이터를 읽어 콘솔에 출력
+    # 이진 파일에서 데이터를 읽어 콘솔에 출력 (v2 형식이면 자동으로 구분)
     try:
+        if is_binary_v2(binary_file):
+            with InventoryBinaryV2(binary_file) as reader:
+                print("\n이진 파일(v2)에서 읽은 데이터:")
+                for record in reader.records():
+                    print(",".join(record))
+            return
+        # 출력할 문자열이 어차피 필요하므로 mmap 조각보다 read() + decode 가 빠름
         with open(binary_file, "rb") as file:
             print("\n이진 파일에서 읽은 데이터:")
             while True:
@@ -84,29 +665,89 @@ def read_from_binary(binary_file):
         print(f"이진 파일 읽기 중 오류가 발생했습니다: {e}")
 
 
-def main():
-    # 고정된 파일 경로 설정
-    input_file = "./w2/data/raw/Mars_Base_Inventory_List.csv"
-    danger_file = "./w2/data/processed/Mars_Base_Inventory_danger.csv"
-    binary_file = "./w2/data/processed/Mars_Base_Inventory_List.bin"
+def _load_sorted_inventory(file_path):
+    # 프로세스 풀 작업: CSV 하나를 읽어 인화성 지수 내림차순으로 정렬하고
+    # (인화성 지수, CSV 한 줄로 인코딩한 UTF-8 바이트) 목록으로 반환
+    # 파싱과 인코딩을 작업자에서 끝내 두어 부모 프로세스는 병합과 쓰기만 함
+    header, data = read_csv_file(file_path)
+    if header is None or data is None:
+        return file_path, None, None
+    table = to_inventory_table(header, data)
+    if table is None:
+        return file_path, None, None
+    flammability = table.flammability
+    entries = [
+        (flammability[index], _encode_record(table.row(index)).encode("utf-8"))
+        for index in table.argsort_by_flammability()
+    ]
+    return file_path, header, entries
+
+
+def consolidate_inventories(
+    input_files, binary_file, danger_file, threshold=0.7, workers=None
+):
+    # 여러 모듈의 인벤토리 CSV 를 프로세스 풀에서 동시에 읽고 정렬한 뒤
+    # 인화성 지수 기준 k-way 병합을 한 번 하면서 이진 파일과 위험 물질 CSV 를 함께 저장
+    header = None
+    sorted_inventories = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for file_path, file_header, entries in executor.map(
+            _load_sorted_inventory, input_files
+        ):
+            if file_header is None:
+                print(f"{file_path} 파일을 건너뜁니다.")
+                continue
+            if header is None:
+                header = file_header
+            elif file_header != header:
+                print(f"{file_path} 파일의 헤더가 달라서 건너뜁니다.")
+                continue
+            sorted_inventories.append(entries)
+
+    if header is None:
+        print("병합할 인벤토리가 없습니다.")
+        return 0
+
+    count = 0
+    try:
+        with open(binary_file, "wb") as binary, open(danger_file, "wb") as danger:
+            # 작업자가 인코딩한 줄을 그대로 씀 (csv.writer 로 한 줄씩 쓴 것과 같은 내용)
+            danger.write(_encode_record(header).encode("utf-8") + b"\n")
+            merged = heapq.merge(*sorted_inventories, key=itemgetter(0), reverse=True)
+            for flammability, line in merged:
+                binary.write(len(line).to_bytes(4, byteorder="big"))
+                binary.write(line)
+                # 내림차순이므로 위험 물질은 앞부분에 모여 있음
+                if flammability >= threshold:
+                    danger.write(line + b"\n")
+                count += 1
+        print(f"{len(sorted_inventories)}개 파일의 {count}개 항목을 {binary_file} 파일에 병합했습니다.")
+        print(f"인화성 지수가 {threshold} 이상인 항목을 {danger_file} 파일에 저장했습니다.")
+    except Exception as e:
+        print(f"병합 파일 저장 중 오류가 발생했습니다: {e}")
+    return count
 
+
+def main():
     # CSV 파일 읽기
-    header, data = read_csv_file(input_file)
+    header, data = read_csv_file(INPUT_FILE)
     if header is None or data is None:
         return
 
-    # 인화성 지수로 정렬
-    sorted_data = sort_by_flammability(data)
-    if sorted_data is None:
+    # 열 단위 표로 변환 (인화성 지수는 여기서 한 번만 숫자로 변환)
+    table = to_inventory_table(header, data)
+    if table is None:
         return
 
+    # 인화성 지수로 정렬
+    order = table.argsort_by_flammability()
+    sorted_data = table.rows(order)
+
     # 인벤토리 출력
     print_inventory(header, sorted_data)
 
     # 인화성 지수가 높은 항목 추출
-    high_flammability = extract_high_flammability(sorted_data)
-    if high_flammability is None:
-        return
+    high_flammability = table.rows(table.select_by_flammability(0.7, order))
 
     # 결과 출력
     print("\n인화성 지수가 0.7 이상인 항목:")
@@ -114,15 +755,23 @@ def main():
         print(",".join(item))
 
     # CSV 파일로 저장
-    save_to_csv(header, high_flammability, danger_file)
+    save_to_csv(header, high_flammability, DANGER_FILE)
 
     # 바이너리 파일로 저장
-    save_to_binary(sorted_data, binary_file)
+    save_to_binary(sorted_data, BINARY_FILE)
 
     # 바이너리 파일 읽기
-    read_from_binary(binary_file)
+    read_from_binary(BINARY_FILE)
 
 
 # 실행
+# python main.py                  : 기본 인벤토리 파일 처리
+# python main.py <CSV 또는 패턴> ... : 여러 모듈의 인벤토리를 병합 (예: "modules/*.csv")
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        input_files = []
+        for pattern in sys.argv[1:]:
+            input_files.extend(sorted(glob.glob(pattern)) or [pattern])
+        consolidate_inventories(input_files, BINARY_FILE, DANGER_FILE)
+    else:
+        main()
@@ -0,0 +1,170 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+from main import (  # noqa: E402
+    InventoryBinaryV1,
+    InventoryTable,
+    InventoryBinaryV2,
+    filter_by_flammability,
+    is_binary_v2,
+    read_csv_typed,
+    save_to_csv,
+    save_to_binary,
+    save_to_binary_v2,
+    stream_inventory,
+)
+
+HEADER = ["Substance", "Weight (g/cm³)", "Specific Gravity", "Strength", "Flammability"]
+ROWS = [
+    ["Acetone", "0.79", "0.79", "Weak", "0.9"],
+    ['Acid, "strong"', "1.2", "1.2", "Strong", "0.8"],
+    ["Multi\nline", "Various", "1", "Medium", "0.8"],
+    ["염화나트륨", "2.16", "2.16", "Strong", "0.4"],
+    ["Water", "1.0", "1.0", "", "0.0"],
+]
+
+
+def quiet(function, *args):
+    # 저장 함수가 출력하는 완료 메시지를 숨기고 실행
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args)
+
+
+class InventoryBinaryV2Test(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "inventory.bin")
+
+    def test_round_trip_keeps_quoted_fields(self):
+        quiet(save_to_binary_v2, HEADER, ROWS, self.path)
+        self.assertTrue(is_binary_v2(self.path))
+        with InventoryBinaryV2(self.path) as reader:
+            self.assertEqual(reader.header, HEADER)
+            self.assertEqual(len(reader), len(ROWS))
+            self.assertTrue(reader.is_sorted)
+            self.assertEqual(list(reader.records()), ROWS)
+            self.assertEqual(reader.record(1), ROWS[1])
+            self.assertEqual(reader.flammability(3), 0.4)
+            with self.assertRaises(IndexError):
+                reader.record(len(ROWS))
+
+        header, rows = stream_inventory(self.path)
+        self.assertEqual(header, HEADER)
+        self.assertEqual(list(rows), ROWS)
+
+    def test_flammability_range_sorted_and_unsorted(self):
+        quiet(save_to_binary_v2, HEADER, ROWS, self.path)
+        with InventoryBinaryV2(self.path) as reader:
+            self.assertEqual(list(reader.find_flammability_range(0.8)), [0, 1, 2])
+            self.assertEqual(list(reader.find_flammability_range(0.4, 0.8)), [1, 2, 3])
+            self.assertEqual(list(reader.find_flammability_range(0.95)), [])
+
+        unsorted = ROWS[::-1]
+        quiet(save_to_binary_v2, HEADER, unsorted, self.path)
+        with InventoryBinaryV2(self.path) as reader:
+            self.assertFalse(reader.is_sorted)
+            self.assertEqual(reader.find_flammability_range(0.8), [2, 3, 4])
+            self.assertEqual([reader.record(index) for index in reader.find_flammability_range(0.8)], unsorted[2:])
+
+    def test_empty_inventory(self):
+        quiet(save_to_binary_v2, HEADER, [], self.path)
+        with InventoryBinaryV2(self.path) as reader:
+            self.assertEqual(reader.header, HEADER)
+            self.assertEqual(len(reader), 0)
+            self.assertEqual(list(reader.records()), [])
+            self.assertEqual(list(reader.find_flammability_range(0.0)), [])
+
+    def test_legacy_binary_is_not_v2(self):
+        quiet(save_to_binary, ROWS, self.path)
+        self.assertFalse(is_binary_v2(self.path))
+        with self.assertRaises(ValueError):
+            InventoryBinaryV2(self.path)
+
+
+class InventoryBinaryV1Test(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "inventory.bin")
+        quiet(save_to_binary, ROWS, self.path)
+
+    def test_readers_agree(self):
+        with InventoryBinaryV1(self.path) as reader:
+            self.assertEqual(list(reader.records()), ROWS)
+            self.assertEqual(reader.count(), len(ROWS))
+            self.assertEqual(list(reader.iter_flammability()), [float(row[-1]) for row in ROWS])
+            self.assertEqual(len([bytes(record) for record in reader]), len(ROWS))
+
+    def test_close_with_suspended_iterator(self):
+        with InventoryBinaryV1(self.path) as reader:
+            records = iter(reader)
+            self.assertEqual(bytes(next(records)), b"Acetone,0.79,0.79,Weak,0.9")
+            iter(reader)
+        self.assertEqual(list(records), [])
+
+
+class SaveToCsvTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "danger.csv")
+        with open(self.path, "w") as file:
+            file.write("previous\n")
+
+    def read(self):
+        with open(self.path) as file:
+            return file.read()
+
+    def test_bad_value_keeps_previous_file(self):
+        rows = [["A", "0.9"], ["B", "oops"], ["C", "0.95"]]
+        saved = quiet(save_to_csv, ["Name", "Flammability"], filter_by_flammability(rows), self.path)
+        self.assertFalse(saved)
+        self.assertEqual(self.read(), "previous\n")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["danger.csv"])
+
+    def test_filtered_rows_are_saved(self):
+        rows = [["A", "0.9"], ["B", "0.1"], ["C", "0.95"]]
+        saved = quiet(save_to_csv, ["Name", "Flammability"], filter_by_flammability(rows), self.path)
+        self.assertTrue(saved)
+        self.assertEqual(self.read(), "Name,Flammability\nA,0.9\nC,0.95\n")
+
+
+class RaggedRowsTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "inventory.csv")
+
+    def read_typed(self, text):
+        with open(self.path, "w") as file:
+            file.write(text)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            header, types, chunks = read_csv_typed(self.path)
+            rows = [row for chunk in chunks for row in chunk]
+        return rows, output.getvalue()
+
+    def test_short_rows_are_padded_before_the_last_field(self):
+        rows, output = self.read_typed("Name,Weight,Flammability\nA,1.0,0.5\nC,0.3\n")
+        self.assertEqual(rows, [["A", 1.0, 0.5], ["C", None, 0.3]])
+        self.assertIn("1개", output)
+        table = InventoryTable.from_rows(["Name", "Weight", "Flammability"], [["C", "0.3"]])
+        self.assertEqual(table.rows(), [["C", "", "0.3"]])
+
+    def test_long_rows_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.read_typed("Name,Weight,Flammability\nA,1.0,0.5\nB,2.0,0.7,EXTRA\n")
+        with self.assertRaises(ValueError):
+            InventoryTable.from_rows(["Name", "Weight", "Flammability"], [["B", "2.0", "0.7", "EXTRA"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,130 @@
+import atexit
+import bisect
+import heapq
+import locale
+import os
 import random
+import re
+import signal
+import sys
+import threading
+import time
 
 # import datetime
 
 # 로그 파일 경로
 LOG_FILE_PATH = "./w3/data/processed/mars_mission_log.txt"
+LOG_FLUSH_INTERVAL = 1.0  # 버퍼를 파일로 내보내는 최대 간격(초)
+LOG_BUFFER_SIZE = 64 * 1024  # 버퍼가 이 크기(문자 수)를 넘으면 바로 기록
+
+# 로그 정렬 인덱스
+LOG_INDEX_PATH = LOG_FILE_PATH + ".idx"
+LOG_INDEX_BLOCK_SIZE = 4096  # 인덱스 항목 사이의 최소 간격(바이트)
+LOG_COMPACT_THRESHOLD = 64  # 순서가 어긋난 항목이 이만큼 쌓이면 병합 정렬
+
+# 로그 항목 하나와 뒤따르는 빈 줄 구분자 (Windows 의 \r\n 도 처리)
+LOG_ENTRY_PATTERN = re.compile(rb"(.*?)\r?\n\r?\n", re.DOTALL)
+
+
+class LogSink:
+    # 로그 파일을 열어 둔 채 메시지를 버퍼에 모았다가 한꺼번에 기록하는 클래스
+    # 같은 파일에는 LogSink.for_path 로 하나의 싱크만 공유해서 여러 버퍼가 뒤섞여 기록되지 않게 함
+    _shared = {}  # 절대 경로: 공유 LogSink
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path, flush_interval=LOG_FLUSH_INTERVAL, max_buffer_size=LOG_BUFFER_SIZE):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self._file = None
+        self._buffer = []
+        self._buffer_size = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._registered = False
+
+    @classmethod
+    def for_path(cls, path, **options):
+        # path 에 쓰는 공유 싱크를 반환 (없으면 만듦)
+        key = os.path.abspath(path)
+        with cls._shared_lock:
+            sink = cls._shared.get(key)
+            if sink is None:
+                sink = cls._shared[key] = cls(path, **options)
+            return sink
+
+    def write(self, message):
+        # 메시지를 버퍼에 추가하고, 크기나 시간 조건이 되면 파일로 내보냄
+        with self._lock:
+            if not self._registered:
+                # 정상 종료나 SIGTERM(SystemExit) 때 남은 버퍼를 디스크에 기록, close() 에서 해제
+                atexit.register(self.close)
+                self._registered = True
+            self._buffer.append(message)
+            self._buffer_size += len(message)
+            if (
+                self._buffer_size >= self.max_buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked(durable=False)
+            elif self._timer is None:
+                # 다음 write 가 없어도 flush_interval 안에 디스크로 내보내도록 타이머를 걸어 둠
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+            self._flush_locked(durable=False)
+
+    def flush(self, durable=False):
+        # 버퍼를 파일로 내보냄, durable=True 이면 fsync 까지 수행
+        with self._lock:
+            self._flush_locked(durable)
+
+    def _flush_locked(self, durable):
+        self._last_flush = time.monotonic()
+        if not self._buffer and not durable:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, "a")
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffer_size = 0
+            self._file.flush()
+            if durable:
+                os.fsync(self._file.fileno())
+        except IOError as e:
+            print(f"파일을 쓸 때 오류가 발생했습니다: {e}")
+
+    def close(self):
+        # 남은 버퍼를 디스크까지 기록하고 파일을 닫음 (다시 write 하면 파일을 다시 엶)
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._buffer or self._file is not None:
+                self._flush_locked(durable=True)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._registered:
+                atexit.unregister(self.close)
+                self._registered = False
+
+
+def exit_on_sigterm(signum, frame):
+    # SIGTERM 을 SystemExit 로 바꿔 atexit 에 등록된 로그 버퍼 정리가 실행되게 함
+    sys.exit(128 + signum)
 
 
 class DummySensor:
-    def __init__(self):
-        # 환경 변수 초기화
+    def __init__(self, log_sink=None):
+        # 로그 싱크와 환경 변수 초기화
+        self.log_sink = log_sink or LogSink.for_path(LOG_FILE_PATH)
         self.env_values = {
             "mars_base_internal_temperature": 0,
             "mars_base_external_temperature": 0,
@@ -39,13 +155,8 @@ class DummySensor:
             f'내부 산소: {self.env_values["mars_base_internal_oxygen"]:.2f}\n\n'
         )
 
-        # 로그 파일에 메시지 추가
-        try:
-            with open(LOG_FILE_PATH, "a") as log_file:
-                log_file.write(log_message)
-        # 예외처리
-        except IOError as e:
-            print(f"파일을 쓸 때 오류가 발생했습니다: {e}")
+        # 로그 싱크에 메시지 추가 (파일은 열린 채로 두고 버퍼가 차거나 일정 시간이 지나면 기록)
+        self.log_sink.write(log_message)
 
         return self.env_values
 
@@ -82,25 +193,167 @@ def get_valid_timestamp():
             print("잘못된 형식입니다. 다시 입력하세요.")
 
 
-def sort_log_file():
-    # 로그 파일 정렬
+def _entry_timestamp(entry):
+    # 로그 항목 첫 줄의 [타임스탬프] 를 문자열로 꺼냄
+    first_line = entry.split(b"\n", 1)[0].strip()
+    return first_line.strip(b"[]").decode("ascii", errors="replace")
+
+
+def _read_log_entries(log_file, start, end=None):
+    # start 위치부터 (타임스탬프, 시작 위치, 구분자를 포함한 항목 바이트) 목록을 읽음
+    # 빈 줄로 끝나지 않은 마지막 항목은 아직 기록 중인 것으로 보고 제외
+    log_file.seek(start)
+    data = log_file.read() if end is None else log_file.read(end - start)
+    entries = []
+    for match in LOG_ENTRY_PATTERN.finditer(data):
+        entries.append((_entry_timestamp(match.group(1)), start + match.start(), match.group(0)))
+    return entries
+
+
+def _ends_entry_at(log_file, offset):
+    # offset 바로 앞이 항목 구분자(빈 줄)의 끝인지 확인 (offset 이 0 이면 True)
+    if offset == 0:
+        return True
+    log_file.seek(max(0, offset - 3))
+    return log_file.read(3).endswith((b"\n\n", b"\n\r\n"))
+
+
+def _load_log_index(log_file):
+    # 인덱스 파일에서 정렬된 구간의 끝 위치, 마지막 타임스탬프, (타임스탬프, 위치) 목록을 읽음
+    # 인덱스가 열린 로그 파일의 것이 아니면(inode, 장치 번호가 다르거나 파일이 줄었거나
+    # 정렬 구간 끝이 항목 경계가 아니면) 로그가 교체된 것으로 보고 빈 인덱스를 반환
+    stat = os.fstat(log_file.fileno())
     try:
-        # 로그 파일 읽기
-        with open(LOG_FILE_PATH, "r") as log_file:
-            log_entries = log_file.read().strip().split("\n\n")
+        with open(LOG_INDEX_PATH, "r", encoding="utf-8") as index_file:
+            inode, device, sorted_end, last_timestamp = (
+                index_file.readline().rstrip("\n").split(",", 3)
+            )
+            entries = []
+            for line in index_file:
+                timestamp, offset = line.rstrip("\n").rsplit(",", 1)
+                entries.append((timestamp, int(offset)))
+            sorted_end = int(sorted_end)
+    except (OSError, ValueError):
+        return 0, "", []
+
+    if (
+        int(inode) != stat.st_ino
+        or int(device) != stat.st_dev
+        or sorted_end > stat.st_size
+        or (sorted_end and not entries)
+        or not _ends_entry_at(log_file, sorted_end)
+    ):
+        return 0, "", []
+    return sorted_end, last_timestamp, entries
+
+
+def _save_log_index(log_file, sorted_end, last_timestamp, entries):
+    # 인덱스를 임시 파일에 쓴 뒤 교체 (어느 로그 파일의 인덱스인지 inode, 장치 번호를 함께 기록)
+    stat = os.fstat(log_file.fileno())
+    temp_path = LOG_INDEX_PATH + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as index_file:
+        index_file.write(f"{stat.st_ino},{stat.st_dev},{sorted_end},{last_timestamp}\n")
+        for timestamp, offset in entries:
+            index_file.write(f"{timestamp},{offset}\n")
+    os.replace(temp_path, LOG_INDEX_PATH)
+
+
+def _add_index_entry(index_entries, timestamp, offset):
+    # 마지막 인덱스 항목에서 LOG_INDEX_BLOCK_SIZE 이상 떨어진 경우에만 새 항목을 추가
+    if not index_entries or offset - index_entries[-1][1] >= LOG_INDEX_BLOCK_SIZE:
+        index_entries.append((timestamp, offset))
+
+
+def _split_log_tail(log_file, sorted_end, last_timestamp, index_entries):
+    # 정렬된 구간 뒤에 붙은 항목 중 시간순인 앞부분은 정렬 구간으로 편입하고
+    # 처음으로 순서가 어긋난 항목부터는 병합 대기 항목으로 반환
+    tail = _read_log_entries(log_file, sorted_end)
+    for position, (timestamp, offset, entry) in enumerate(tail):
+        if timestamp < last_timestamp:
+            return sorted_end, last_timestamp, tail[position:]
+        _add_index_entry(index_entries, timestamp, offset)
+        sorted_end = offset + len(entry)
+        last_timestamp = timestamp
+    return sorted_end, last_timestamp, []
+
+
+def _compact_log(log_file, sorted_end, index_entries, pending):
+    # 대기 항목을 정렬한 뒤 정렬 구간 중 가장 이른 대기 항목보다 뒤에 있는 부분과만 병합해서
+    # 그 위치부터 파일 끝까지 제자리에서 다시 씀 (앞부분은 건드리지 않음)
+    pending = sorted(pending, key=lambda item: item[0])
+    first_timestamp = pending[0][0]
 
-        # 시간순으로 정렬
-        log_entries.sort(key=lambda entry: entry.split("\n")[0].strip("[]"))
+    # 인덱스에서 병합이 시작될 블록을 찾고, 블록 안에서 정확한 위치를 찾음
+    position = bisect.bisect_right([entry[0] for entry in index_entries], first_timestamp) - 1
+    block_start = index_entries[position][1] if position >= 0 else 0
+    rewrite_start = sorted_end
+    for timestamp, offset, entry in _read_log_entries(log_file, block_start, sorted_end):
+        if timestamp > first_timestamp:
+            rewrite_start = offset
+            break
+    suffix = _read_log_entries(log_file, rewrite_start, sorted_end)
 
-        # 정렬된 로그 파일 쓰기
-        with open(LOG_FILE_PATH, "w") as log_file:
-            log_file.write("\n\n".join(log_entries) + "\n\n")
+    # 같은 타임스탬프면 원래 파일에서 앞에 있던 항목이 먼저 오도록 정렬 구간을 앞에 둠
+    merged = list(heapq.merge(suffix, pending, key=lambda item: item[0]))
+    log_file.seek(rewrite_start)
+    log_file.write(b"".join(entry for _, _, entry in merged))
+    log_file.flush()
+    os.fsync(log_file.fileno())
+
+    # 다시 쓴 구간의 인덱스 항목을 새로 만듦
+    del index_entries[bisect.bisect_left([entry[1] for entry in index_entries], rewrite_start):]
+    offset = rewrite_start
+    for timestamp, _, entry in merged:
+        _add_index_entry(index_entries, timestamp, offset)
+        offset += len(entry)
+    return offset, merged[-1][0]
+
+
+def sort_log_file(compact_threshold=LOG_COMPACT_THRESHOLD):
+    # 로그 파일 정렬
+    # 파일 전체를 다시 쓰지 않고, 인덱스에 기록된 정렬 구간 뒤에 새로 붙은 항목만 확인
+    # 시간순으로 붙은 항목은 그대로 정렬 구간이 되고, 순서가 어긋난 항목은
+    # compact_threshold 개 이상 쌓였을 때 필요한 뒷부분만 병합해서 다시 씀
+    try:
+        with open(LOG_FILE_PATH, "r+b") as log_file:
+            # 로그가 교체되었거나 줄었으면 인덱스를 처음부터 다시 만듦
+            # (다른 파일의 위치로 제자리 병합을 하면 로그가 망가지므로 반드시 먼저 확인)
+            sorted_end, last_timestamp, index_entries = _load_log_index(log_file)
+
+            sorted_end, last_timestamp, pending = _split_log_tail(
+                log_file, sorted_end, last_timestamp, index_entries
+            )
+            if pending and len(pending) >= compact_threshold:
+                sorted_end, last_timestamp = _compact_log(
+                    log_file, sorted_end, index_entries, pending
+                )
+            _save_log_index(log_file, sorted_end, last_timestamp, index_entries)
     # 예외처리
     except IOError as e:
         print(f"파일을 읽거나 쓸 때 오류가 발생했습니다: {e}")
 
 
+def read_log_entries():
+    # 로그 항목을 시간순으로 반환 (아직 병합되지 않은 항목도 정렬해서 함께 돌려줌)
+    encoding = locale.getpreferredencoding(False)
+    try:
+        with open(LOG_FILE_PATH, "rb") as log_file:
+            sorted_end, last_timestamp, index_entries = _load_log_index(log_file)
+            sorted_part = _read_log_entries(log_file, 0, sorted_end)
+            pending = sorted(_read_log_entries(log_file, sorted_end), key=lambda item: item[0])
+    except IOError as e:
+        print(f"파일을 읽을 때 오류가 발생했습니다: {e}")
+        return []
+    return [
+        entry.decode(encoding, errors="replace").strip()
+        for _, _, entry in heapq.merge(sorted_part, pending, key=lambda item: item[0])
+    ]
+
+
 if __name__ == "__main__":
+    # SIGTERM 으로 종료될 때도 로그 버퍼를 기록
+    signal.signal(signal.SIGTERM, exit_on_sigterm)
+
     # DummySensor
     ds = DummySensor()
     ds.set_env()
@@ -121,5 +374,8 @@ if __name__ == "__main__":
     env_data = ds.get_env(timestamp)
     print(env_data)
 
+    # 정렬 전에 버퍼에 남은 로그를 파일에 기록
+    ds.log_sink.close()
+
     # 로그 파일 정렬
     sort_log_file()
\ No newline at end of file
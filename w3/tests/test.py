@@ -0,0 +1,144 @@
+import locale
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+import mars_mission_computer  # noqa: E402
+from mars_mission_computer import read_log_entries, sort_log_file  # noqa: E402
+
+
+def make_entry(timestamp, value):
+    # DummySensor.get_env 와 같은 모양의 로그 항목 (빈 줄로 끝남)
+    return f"[{timestamp}]\n내부 온도: {value:.2f}\n\n".encode("utf-8")
+
+
+def timestamp_of(second):
+    return f"2025-03-27 00:{second // 60:02d}:{second % 60:02d}"
+
+
+class SortLogFileTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.log_path = os.path.join(temp_dir.name, "mars_mission_log.txt")
+        self.index_path = self.log_path + ".idx"
+        # 인덱스 항목이 여러 개 생기도록 블록 크기를 줄임
+        for name, value in [
+            ("LOG_FILE_PATH", self.log_path),
+            ("LOG_INDEX_PATH", self.index_path),
+            ("LOG_INDEX_BLOCK_SIZE", 64),
+        ]:
+            patcher = mock.patch.object(mars_mission_computer, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.entries = []
+
+    def append(self, *entries, raw=b""):
+        # 항목을 로그 끝에 붙이고 삽입 순서를 기억함
+        with open(self.log_path, "ab") as log_file:
+            log_file.write(b"".join(entries) + raw)
+        self.entries.extend(entries)
+
+    def read_log(self):
+        with open(self.log_path, "rb") as log_file:
+            return log_file.read()
+
+    def expected(self):
+        # 같은 타임스탬프는 먼저 기록된 항목이 앞에 오는 안정 정렬 결과
+        return b"".join(sorted(self.entries, key=mars_mission_computer._entry_timestamp))
+
+    def expected_entries(self):
+        # read_log_entries 와 같은 방식으로 디코드한 기대 결과
+        encoding = locale.getpreferredencoding(False)
+        return [
+            entry.decode(encoding, errors="replace").strip()
+            for entry in sorted(self.entries, key=mars_mission_computer._entry_timestamp)
+        ]
+
+    def test_in_order_appends_are_not_rewritten(self):
+        self.append(*(make_entry(timestamp_of(i), i) for i in range(20)))
+        before = self.read_log()
+        sort_log_file(compact_threshold=1)
+        self.append(*(make_entry(timestamp_of(i), i) for i in range(20, 30)))
+        sort_log_file(compact_threshold=1)
+        self.assertEqual(self.read_log(), before + b"".join(self.entries[20:]))
+        with open(self.index_path, "r", encoding="utf-8") as index_file:
+            sorted_end = int(index_file.readline().split(",")[2])
+        self.assertEqual(sorted_end, len(self.read_log()))
+
+    def test_out_of_order_entries_are_compacted(self):
+        self.append(*(make_entry(timestamp_of(i * 2), i) for i in range(20)))
+        sort_log_file(compact_threshold=3)
+        late = [make_entry(timestamp_of(i), -i) for i in (31, 5, 17)]
+
+        # 임계값보다 적으면 파일은 그대로지만 읽을 때는 정렬되어 나옴
+        self.append(*late[:2])
+        unsorted = self.read_log()
+        sort_log_file(compact_threshold=3)
+        self.assertEqual(self.read_log(), unsorted)
+        self.assertEqual(
+            read_log_entries(),
+            self.expected_entries(),
+        )
+
+        self.append(late[2])
+        sort_log_file(compact_threshold=3)
+        self.assertEqual(self.read_log(), self.expected())
+
+    def test_partial_trailing_entry_is_left_alone(self):
+        self.append(*(make_entry(timestamp_of(i), i) for i in range(10, 20)))
+        self.append(make_entry(timestamp_of(3), 3), make_entry(timestamp_of(1), 1))
+        partial = make_entry(timestamp_of(2), 2)
+        self.append(raw=partial[:-3])
+        sort_log_file(compact_threshold=1)
+        self.assertEqual(self.read_log(), self.expected() + partial[:-3])
+
+        # 나머지가 기록되면 다음 정렬에서 함께 병합됨
+        self.append(raw=partial[-3:])
+        self.entries.append(partial)
+        sort_log_file(compact_threshold=1)
+        self.assertEqual(self.read_log(), self.expected())
+
+    def test_ties_keep_insertion_order(self):
+        self.append(*(make_entry(timestamp_of(i // 3), i) for i in range(12)))
+        sort_log_file(compact_threshold=1)
+        self.append(make_entry(timestamp_of(1), 100), make_entry(timestamp_of(0), 101), make_entry(timestamp_of(1), 102))
+        sort_log_file(compact_threshold=1)
+        self.assertEqual(self.read_log(), self.expected())
+
+    def test_replaced_log_is_reindexed(self):
+        self.append(*(make_entry(timestamp_of(i), i) for i in range(10)))
+        sort_log_file(compact_threshold=1)
+
+        # 더 큰 다른 파일로 교체되면 예전 인덱스의 위치로 다시 쓰면 안 됨
+        replacement = [make_entry(timestamp_of(i), i) for i in (40, 30, 35, 20, 25, 45, 10, 15, 50, 5, 0, 55)]
+        temp_path = self.log_path + ".new"
+        with open(temp_path, "wb") as log_file:
+            log_file.write(b"".join(replacement))
+        os.replace(temp_path, self.log_path)
+        self.entries = replacement
+        sort_log_file(compact_threshold=1)
+        self.assertEqual(self.read_log(), self.expected())
+
+    def test_random_batches_match_stable_sort(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            batch = [make_entry(timestamp_of(rng.randrange(200)), rng.random()) for _ in range(rng.randint(1, 30))]
+            self.append(*batch)
+            sort_log_file(compact_threshold=rng.randint(1, 10))
+            self.assertEqual(
+                read_log_entries(),
+                self.expected_entries(),
+            )
+        sort_log_file(compact_threshold=1)
+        self.assertEqual(self.read_log(), self.expected())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,113 @@
+import atexit
+import os
 import random
+import signal
+import sys
+import threading
 import time
 
 # 상수 정의
 AVG_INTERVAL = 60  # 5분(5초 * 60회) 주기
+LOG_FILE_PATH = './w4/data/processed/mars_mission_log.txt'
+LOG_FLUSH_INTERVAL = 1.0  # 버퍼를 파일로 내보내는 최대 간격(초)
+LOG_BUFFER_SIZE = 64 * 1024  # 버퍼가 이 크기(문자 수)를 넘으면 바로 기록
+
+class LogSink:
+    # 로그 파일을 열어 둔 채 메시지를 버퍼에 모았다가 한꺼번에 기록하는 클래스
+    # 같은 파일에는 LogSink.for_path 로 하나의 싱크만 공유해서 여러 버퍼가 뒤섞여 기록되지 않게 함
+    _shared = {}  # 절대 경로: 공유 LogSink
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path, flush_interval=LOG_FLUSH_INTERVAL, max_buffer_size=LOG_BUFFER_SIZE):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self._file = None
+        self._buffer = []
+        self._buffer_size = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._registered = False
+
+    @classmethod
+    def for_path(cls, path, **options):
+        # path 에 쓰는 공유 싱크를 반환 (없으면 만듦)
+        key = os.path.abspath(path)
+        with cls._shared_lock:
+            sink = cls._shared.get(key)
+            if sink is None:
+                sink = cls._shared[key] = cls(path, **options)
+            return sink
+
+    def write(self, message):
+        # 메시지를 버퍼에 추가하고, 크기나 시간 조건이 되면 파일로 내보냄
+        with self._lock:
+            if not self._registered:
+                # 정상 종료나 SIGTERM(SystemExit) 때 남은 버퍼를 디스크에 기록, close() 에서 해제
+                atexit.register(self.close)
+                self._registered = True
+            self._buffer.append(message)
+            self._buffer_size += len(message)
+            if (
+                self._buffer_size >= self.max_buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked(durable=False)
+            elif self._timer is None:
+                # 다음 write 가 없어도 flush_interval 안에 디스크로 내보내도록 타이머를 걸어 둠
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+            self._flush_locked(durable=False)
+
+    def flush(self, durable=False):
+        # 버퍼를 파일로 내보냄, durable=True 이면 fsync 까지 수행
+        with self._lock:
+            self._flush_locked(durable)
+
+    def _flush_locked(self, durable):
+        self._last_flush = time.monotonic()
+        if not self._buffer and not durable:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'a')
+            self._file.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._buffer_size = 0
+            self._file.flush()
+            if durable:
+                os.fsync(self._file.fileno())
+        except IOError as e:
+            print(f'파일을 쓸 때 오류가 발생했습니다: {e}')
+
+    def close(self):
+        # 남은 버퍼를 디스크까지 기록하고 파일을 닫음 (다시 write 하면 파일을 다시 엶)
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._buffer or self._file is not None:
+                self._flush_locked(durable=True)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._registered:
+                atexit.unregister(self.close)
+                self._registered = False
+
+def exit_on_sigterm(signum, frame):
+    # SIGTERM 을 SystemExit 로 바꿔 atexit 에 등록된 로그 버퍼 정리가 실행되게 함
+    sys.exit(128 + signum)
 
 class DummySensor:
-    def __init__(self):
+    def __init__(self, log_sink=None):
+        self.log_sink = log_sink or LogSink.for_path(LOG_FILE_PATH)
         self.env_values = {
             'mars_base_internal_temperature': 0,
             'mars_base_external_temperature': 0,
@@ -27,7 +129,7 @@ class DummySensor:
         }
 
     def log_env(self, timestamp):
-        # 로그 메시지 생성 및 파일에 기록
+        # 로그 메시지 생성 후 버퍼링된 로그 싱크에 기록
         log_message = (
             f'[{timestamp}]\n'
             f'내부 온도: {self.env_values["mars_base_internal_temperature"]:.2f}\n'
@@ -37,11 +139,7 @@ class DummySensor:
             f'내부 CO2: {self.env_values["mars_base_internal_co2"]:.2f}\n'
             f'내부 산소: {self.env_values["mars_base_internal_oxygen"]:.2f}\n\n'
         )
-        try:
-            with open('./w4/data/processed/mars_mission_log.txt', 'a') as log_file:
-                log_file.write(log_message)
-        except IOError as e:
-            print(f'파일을 쓸 때 오류가 발생했습니다: {e}')
+        self.log_sink.write(log_message)
 
 class MissionComputer:
     def __init__(self):
@@ -104,8 +202,10 @@ class MissionComputer:
 
     def stop(self):
         self.running = False
+        self.ds.log_sink.close()
         print('System stopped.')
 
 if __name__ == '__main__':
+    signal.signal(signal.SIGTERM, exit_on_sigterm)
     RunComputer = MissionComputer()
     RunComputer.get_sensor_data()
\ No newline at end of file
@@ -0,0 +1,246 @@
+import contextlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from mars_mission_computer import (
+    DummySensor,
+    LogSink,
+    MissionComputer,
+    SampleSerializer,
+    TelemetryReader,
+    TelemetryWriter,
+    convert_text_log,
+    get_static_system_info,
+    parse_text_log,
+    probe_static_system_info,
+)
+
+SAMPLES = 100000
+BATCH_SAMPLES = 1000000
+TELEMETRY_SAMPLES = 1000000
+OUTPUT_SAMPLES = 200000
+STARTUP_RUNS = 10
+
+
+def log_env_per_call(sensor, timestamp, log_file_path):
+    # 기존 방식: 샘플마다 파일을 열고 닫음
+    log_message = (
+        f'[{timestamp}]\n'
+        f'내부 온도: {sensor.env_values["mars_base_internal_temperature"]:.2f}\n'
+        f'외부 온도: {sensor.env_values["mars_base_external_temperature"]:.2f}\n'
+        f'내부 습도: {sensor.env_values["mars_base_internal_humidity"]:.2f}\n'
+        f'외부 광량: {sensor.env_values["mars_base_external_illuminance"]:.2f}\n'
+        f'내부 CO2: {sensor.env_values["mars_base_internal_co2"]:.2f}\n'
+        f'내부 산소: {sensor.env_values["mars_base_internal_oxygen"]:.2f}\n\n'
+    )
+    with open(log_file_path, 'a') as log_file:
+        log_file.write(log_message)
+
+
+def benchmark_log_sink(samples=SAMPLES):
+    """샘플마다 파일을 여는 방식과 LogSink 의 초당 기록 샘플 수 비교"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        per_call_path = os.path.join(temp_dir, 'per_call.txt')
+        sink_path = os.path.join(temp_dir, 'sink.txt')
+
+        sensor = DummySensor(LogSink(per_call_path))
+        sensor.set_env()
+        start = time.perf_counter()
+        for i in range(samples):
+            log_env_per_call(sensor, f'T+{i * 5} sec', per_call_path)
+        per_call = samples / (time.perf_counter() - start)
+
+        sink = LogSink(sink_path)
+        sensor = DummySensor(sink)
+        start = time.perf_counter()
+        for i in range(samples):
+            sensor.log_env(f'T+{i * 5} sec')
+        sink.close()
+        buffered = samples / (time.perf_counter() - start)
+
+    print(f'샘플마다 open/close : {per_call:12.0f} samples/s')
+    print(f'LogSink 버퍼링      : {buffered:12.0f} samples/s (x{buffered / per_call:.1f})')
+
+
+def benchmark_batch(samples=BATCH_SAMPLES):
+    """set_env 반복 호출과 generate_batch 의 초당 생성 샘플 수 비교"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sink = LogSink(os.path.join(temp_dir, 'batch.txt'))
+        sensor = DummySensor(sink, seed=0)
+
+        start = time.perf_counter()
+        for _ in range(samples):
+            sensor.set_env()
+        per_call = samples / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batch = sensor.generate_batch(samples)
+        batched = samples / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        sensor.log_batch(batch)
+        sink.close()
+        logged = samples / (time.perf_counter() - start)
+
+    print(f'set_env 반복       : {per_call:12.0f} samples/s')
+    print(f'generate_batch     : {batched:12.0f} samples/s (x{batched / per_call:.1f})')
+    print(f'log_batch 기록     : {logged:12.0f} samples/s')
+
+
+def benchmark_telemetry(samples=TELEMETRY_SAMPLES):
+    """텍스트 로그와 이진 텔레메트리의 파일 크기, 전체 읽기, 구간 조회 시간 비교"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        text_path = os.path.join(temp_dir, 'log.txt')
+        sink = LogSink(text_path)
+        sensor = DummySensor(sink, seed=0)
+        batch = sensor.generate_batch(samples)
+        sensor.log_batch(batch)
+        sink.close()
+
+        start = time.perf_counter()
+        convert_text_log(text_path, os.path.join(temp_dir, 'converted.bin'))
+        convert_time = time.perf_counter() - start
+
+        sizes = {'텍스트 로그': os.path.getsize(text_path)}
+        for typecode in ('f', 'd'):
+            binary_path = os.path.join(temp_dir, f'log_{typecode}.bin')
+            with TelemetryWriter(binary_path, typecode=typecode) as writer:
+                writer.write_batch(batch)
+            sizes[f'이진 float{32 if typecode == "f" else 64}'] = os.path.getsize(binary_path)
+
+        start = time.perf_counter()
+        for _ in parse_text_log(text_path):
+            pass
+        text_time = time.perf_counter() - start
+
+        with TelemetryReader(os.path.join(temp_dir, 'log_f.bin')) as reader:
+            start = time.perf_counter()
+            for _ in reader.records():
+                pass
+            binary_time = time.perf_counter() - start
+
+            # 전체 구간의 가운데 1% 만 조회
+            low = samples * 5 // 2
+            high = low + samples * 5 // 100
+            start = time.perf_counter()
+            for _ in reader.iter_range(low, high):
+                pass
+            range_time = time.perf_counter() - start
+
+    text_size = sizes['텍스트 로그']
+    for name, size in sizes.items():
+        print(f'{name:<12} {size / 1024 / 1024:8.1f} MB (x{text_size / size:.1f} 작음)')
+    print(f'텍스트 파싱       : {samples / text_time:12.0f} samples/s')
+    print(f'이진 전체 읽기    : {samples / binary_time:12.0f} samples/s (x{text_time / binary_time:.1f})')
+    print(f'이진 1% 구간 조회 : {range_time * 1000:12.2f} ms')
+    print(f'텍스트 -> 이진 변환: {convert_time:11.2f}초')
+
+
+def print_json_per_key(data, title=''):
+    # 기존 방식: 키마다 print 를 한 번씩 호출
+    if title:
+        print(f'{title}:')
+    print('{')
+    for i, (key, value) in enumerate(data.items()):
+        comma = ',' if i < len(data) - 1 else ''
+        if isinstance(value, (int, float)):
+            print(f'    "{key}": {value:.2f}{comma}')
+        else:
+            print(f'    "{key}": "{value}"{comma}')
+    print('}')
+
+
+def benchmark_output(samples=OUTPUT_SAMPLES):
+    """키마다 print 하던 기존 출력, 한 번에 print 하는 text, NDJSON, msgpack 의 초당 출력 샘플 수 비교"""
+    sensor = DummySensor(LogSink(os.devnull), seed=0)
+    sensor.set_env()
+    values = sensor.env_values
+    results = {}
+    # 터미널의 표준 출력처럼 줄 단위 버퍼링으로 열어서 print 마다 write 가 일어나게 함
+    with open(os.devnull, 'w', buffering=1) as null_text, open(os.devnull, 'wb') as null_binary:
+        computer = MissionComputer()
+        with contextlib.redirect_stdout(null_text):
+            start = time.perf_counter()
+            for _ in range(samples):
+                print_json_per_key(values, '현재 환경 데이터')
+            results['키마다 print'] = samples / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for _ in range(samples):
+                computer.print_json(values, '현재 환경 데이터')
+            results['text'] = samples / (time.perf_counter() - start)
+
+        for output_format in ('ndjson', 'msgpack'):
+            computer.serializer = SampleSerializer(output_format, null_binary)
+            start = time.perf_counter()
+            for _ in range(samples):
+                computer.print_json(values, '현재 환경 데이터')
+            computer.serializer.close()
+            results[output_format] = samples / (time.perf_counter() - start)
+
+    baseline = results['키마다 print']
+    for name, rate in results.items():
+        print(f'{name:<12}: {rate:12.0f} samples/s (x{rate / baseline:.1f})')
+
+
+def time_startup(cache_path, runs):
+    # 새 프로세스에서 모듈을 불러와 시스템 정보를 한 번 출력하기까지의 평균 시간
+    code = (
+        'import mars_mission_computer as m; '
+        f'm.MissionComputer(system_info_cache={cache_path!r}).get_mission_computer_info()'
+    )
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    start = time.perf_counter()
+    for _ in range(runs):
+        subprocess.run([sys.executable, '-c', code], cwd=src_dir, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) / runs
+
+
+def benchmark_startup(runs=STARTUP_RUNS):
+    """시스템 정보를 매번 조사할 때와 캐시를 쓸 때의 시작 시간과 호출 시간 비교"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_path = os.path.join(temp_dir, 'system_info_cache.json')
+        no_cache = time_startup(None, runs)
+        time_startup(cache_path, 1)  # 캐시 파일 만들기
+        disk_cache = time_startup(cache_path, runs)
+
+    calls = 1000
+    start = time.perf_counter()
+    for _ in range(calls):
+        probe_static_system_info()
+    probe_time = (time.perf_counter() - start) / calls
+    get_static_system_info(None)
+    start = time.perf_counter()
+    for _ in range(calls):
+        get_static_system_info(None)
+    cached_time = (time.perf_counter() - start) / calls
+
+    print(f'시작 (매번 조사)       : {no_cache * 1000:10.1f} ms')
+    print(f'시작 (부팅 ID 캐시)    : {disk_cache * 1000:10.1f} ms')
+    print(f'호출당 조사            : {probe_time * 1e6:10.1f} us')
+    print(f'호출당 캐시            : {cached_time * 1e6:10.3f} us')
+
+
+if __name__ == '__main__':
+    # 사용법: python w5/src/benchmark.py sink [샘플 수]
+    #         python w5/src/benchmark.py batch [샘플 수]
+    #         python w5/src/benchmark.py telemetry [샘플 수]
+    #         python w5/src/benchmark.py output [샘플 수]
+    #         python w5/src/benchmark.py startup [실행 횟수]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'sink'
+    args = [int(arg) for arg in sys.argv[2:]]
+    if command == 'sink':
+        benchmark_log_sink(args[0] if args else SAMPLES)
+    elif command == 'batch':
+        benchmark_batch(args[0] if args else BATCH_SAMPLES)
+    elif command == 'telemetry':
+        benchmark_telemetry(args[0] if args else TELEMETRY_SAMPLES)
+    elif command == 'output':
+        benchmark_output(args[0] if args else OUTPUT_SAMPLES)
+    elif command == 'startup':
+        benchmark_startup(args[0] if args else STARTUP_RUNS)
+    else:
+        print(f'알 수 없는 벤치마크입니다: {command}')
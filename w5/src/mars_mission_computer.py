@@ -1,17 +1,226 @@
 import random
 import time
-import platform
 import os
-import sys
-import psutil  # 실시간 부하 정보를 가져오기 위해 추가
+import sys  # 인터프리터가 항상 먼저 불러 두는 내장 모듈이라 지연할 필요가 없음
+import atexit
+import bisect
+import functools
+import importlib
+import itertools
+import math
+import mmap
+import operator
+import queue
+import signal
+import struct
+import threading
+from array import array
+from collections import deque
+from collections.abc import Mapping
+
+
+class LazyModule:
+    """처음 속성에 접근할 때 모듈을 불러오는 대리 객체
+
+    감시 프로그램이 자주 다시 시작하므로 psutil, platform, asyncio 처럼 무겁거나 일부 기능에서만
+    쓰는 모듈은 실제로 쓸 때 불러온다. 불러온 뒤에는 namespace 의 같은 이름을 진짜 모듈로
+    바꿔 끼우므로 그다음부터는 일반 import 와 똑같이 접근한다.
+    """
+    def __init__(self, name, namespace):
+        self._name = name
+        self._namespace = namespace
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        if self._namespace.get(self._name) is self:
+            self._namespace[self._name] = module
+        return getattr(module, attr)
+
+
+asyncio = LazyModule('asyncio', globals())
+json = LazyModule('json', globals())
+platform = LazyModule('platform', globals())
+psutil = LazyModule('psutil', globals())  # 실시간 부하 정보를 가져오기 위해 추가
+re = LazyModule('re', globals())
 
 # 상수 정의
 AVG_INTERVAL = 60  # 5분(5초 * 60회) 주기
 LOG_FILE_PATH = './w5/data/processed/mars_mission_log.txt'
+LOG_FLUSH_INTERVAL = 1.0  # 버퍼를 파일로 내보내는 최대 간격(초)
+LOG_BUFFER_SIZE = 64 * 1024  # 버퍼가 이 크기(문자 수)를 넘으면 바로 기록
+SAMPLE_PERIOD = 5  # 센서 측정 주기(초)
+SENSOR_RANGES = {  # 환경 변수별 랜덤 값 범위
+    'mars_base_internal_temperature': (18, 30),
+    'mars_base_external_temperature': (0, 21),
+    'mars_base_internal_humidity': (50, 60),
+    'mars_base_external_illuminance': (500, 715),
+    'mars_base_internal_co2': (0.02, 0.1),
+    'mars_base_internal_oxygen': (4, 7),
+}
+LOG_ENTRY_TEMPLATE = (  # log_env 와 같은 형식, log_batch 에서 한꺼번에 채움
+    '[{}]\n'
+    '내부 온도: {:.2f}\n'
+    '외부 온도: {:.2f}\n'
+    '내부 습도: {:.2f}\n'
+    '외부 광량: {:.2f}\n'
+    '내부 CO2: {:.2f}\n'
+    '내부 산소: {:.2f}\n\n'
+)
+STATS_WINDOWS = {  # 통계 구간 이름: 샘플 수 (5초 주기 기준)
+    '5분': AVG_INTERVAL,
+    '1시간': 3600 // SAMPLE_PERIOD,
+    '24시간': 86400 // SAMPLE_PERIOD,
+}
+LOG_LABELS = {  # 텍스트 로그의 한글 항목 이름: 환경 변수 이름
+    '내부 온도': 'mars_base_internal_temperature',
+    '외부 온도': 'mars_base_external_temperature',
+    '내부 습도': 'mars_base_internal_humidity',
+    '외부 광량': 'mars_base_external_illuminance',
+    '내부 CO2': 'mars_base_internal_co2',
+    '내부 산소': 'mars_base_internal_oxygen',
+}
+LOG_FALLBACK_ENCODING = 'cp949'  # UTF-8 로 읽을 수 없는 예전 로그의 인코딩
+LOG_TIMESTAMP_PATTERN = r'T\+(-?[0-9.]+) sec'  # 로그 머리 줄 [T+n sec] 의 시각
+TELEMETRY_FILE_PATH = './w5/data/processed/mars_mission_telemetry.bin'
+TELEMETRY_MAGIC = b'MTEL'
+TELEMETRY_VERSION = 1
+TELEMETRY_SYNC_MAGIC = b'MTELSYNC'
+TELEMETRY_SYNC_INTERVAL = 4096  # 동기화 표식 사이의 레코드 수
+OUTPUT_FORMATS = ('text', 'ndjson', 'msgpack')  # print_json 출력 형식
+OUTPUT_FLUSH_INTERVAL = 0.2  # 출력 버퍼를 내보내는 최대 간격(초)
+OUTPUT_BUFFER_SIZE = 64 * 1024  # 출력 버퍼가 이 크기(바이트)를 넘으면 바로 내보냄
+# setting.txt 와 시스템 정보 캐시는 실행 위치와 관계없이 w5/ 폴더(src 의 상위 폴더) 기준으로 찾음
+W5_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS_FILE_PATH = os.path.join(W5_DIR, 'setting.txt')
+SYSTEM_INFO_CACHE_PATH = os.path.join(W5_DIR, 'data', 'processed', 'system_info_cache.json')
+BOOT_ID_PATH = '/proc/sys/kernel/random/boot_id'  # 부팅할 때마다 바뀌는 리눅스 부팅 ID
+SETTINGS_CHECK_INTERVAL = 1.0  # setting.txt 변경 여부(mtime)를 확인하는 최소 간격(초)
+DEFAULT_SETTINGS = {  # setting.txt 가 없거나 항목이 빠졌을 때 쓰는 출력 항목 설정
+    'operating_system': True,
+    'os_version': True,
+    'cpu_type': True,
+    'cpu_cores': True,
+    'memory_size_mb': True,
+    'cpu_usage_percent': True,
+    'memory_usage_percent': True,
+}
+LOAD_SAMPLE_INTERVAL = 0.5  # 시스템 부하 측정 주기(초)
+LOAD_HISTORY_SIZE = 120  # 보관할 부하 스냅숏 수 (0.5초 주기면 1분)
+
+# 텔레메트리 파일 머리말: 매직, 버전, 값 형식('f' 또는 'd'), 항목 수, 동기화 간격, 항목 이름 길이
+_TELEMETRY_HEADER = struct.Struct('<4sBcHII')
+# 동기화 표식: 매직, 표식 뒤에 오는 첫 레코드 번호
+_TELEMETRY_SYNC = struct.Struct('<8sQ')
+_TIMESTAMP = struct.Struct('<d')
+_MSGPACK_FLOAT = struct.Struct('>Bd')
+_FLOAT64 = struct.Struct('>d')
+_FLOAT_TYPES = frozenset((float,))
+_MSGPACK_INT = struct.Struct('>Bq')
+
+class LogSink:
+    """로그 파일을 열어 둔 채 메시지를 버퍼에 모았다가 한꺼번에 기록하는 클래스
+
+    같은 파일에는 LogSink.for_path 로 하나의 싱크만 공유해서 여러 버퍼가 뒤섞여 기록되지 않게 한다.
+    """
+    _shared = {}  # 절대 경로: 공유 LogSink
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path, flush_interval=LOG_FLUSH_INTERVAL, max_buffer_size=LOG_BUFFER_SIZE):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self._file = None
+        self._buffer = []
+        self._buffer_size = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._registered = False
+
+    @classmethod
+    def for_path(cls, path, **options):
+        """path 에 쓰는 공유 싱크를 반환 (없으면 만듦)"""
+        key = os.path.abspath(path)
+        with cls._shared_lock:
+            sink = cls._shared.get(key)
+            if sink is None:
+                sink = cls._shared[key] = cls(path, **options)
+            return sink
+
+    def write(self, message):
+        """메시지를 버퍼에 추가하고, 크기나 시간 조건이 되면 파일로 내보냄"""
+        with self._lock:
+            if not self._registered:
+                # 정상 종료나 SIGTERM(SystemExit) 때 남은 버퍼를 디스크에 기록, close() 에서 해제
+                atexit.register(self.close)
+                self._registered = True
+            self._buffer.append(message)
+            self._buffer_size += len(message)
+            if (
+                self._buffer_size >= self.max_buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked(durable=False)
+            elif self._timer is None:
+                # 다음 write 가 없어도 flush_interval 안에 디스크로 내보내도록 타이머를 걸어 둠
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+            self._flush_locked(durable=False)
+
+    def flush(self, durable=False):
+        """버퍼를 파일로 내보냄, durable=True 이면 fsync 까지 수행"""
+        with self._lock:
+            self._flush_locked(durable)
+
+    def _flush_locked(self, durable):
+        self._last_flush = time.monotonic()
+        if not self._buffer and not durable:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'a')
+            self._file.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._buffer_size = 0
+            self._file.flush()
+            if durable:
+                os.fsync(self._file.fileno())
+        except IOError as e:
+            print(f'파일을 쓸 때 오류가 발생했습니다: {e}')
+
+    def close(self):
+        """남은 버퍼를 디스크까지 기록하고 파일을 닫음 (다시 write 하면 파일을 다시 엶)"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._buffer or self._file is not None:
+                self._flush_locked(durable=True)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._registered:
+                atexit.unregister(self.close)
+                self._registered = False
+
+def _json_string(text):
+    """문자열을 따옴표와 이스케이프가 들어간 JSON 문자열로 바꿈"""
+    return json.encoder.encode_basestring(text)
+
+def exit_on_sigterm(signum, frame):
+    """SIGTERM 을 SystemExit 로 바꿔 atexit 에 등록된 로그 버퍼 정리가 실행되게 함"""
+    sys.exit(128 + signum)
 
 class DummySensor:
     """화성 기지 환경 데이터를 생성하고 로깅하는 클래스"""
-    def __init__(self):
+    def __init__(self, log_sink=None, seed=None):
+        self.log_sink = log_sink or LogSink.for_path(LOG_FILE_PATH)
+        self.rng = random.Random(seed)  # seed 를 주면 같은 값을 재현할 수 있음
         self.env_values = {
             'mars_base_internal_temperature': 0,
             'mars_base_external_temperature': 0,
@@ -23,75 +232,1158 @@ class DummySensor:
 
     def set_env(self):
         """환경 변수에 랜덤 값을 설정"""
+        uniform = self.rng.uniform
         self.env_values.update({
-            'mars_base_internal_temperature': round(random.uniform(18, 30), 2),
-            'mars_base_external_temperature': round(random.uniform(0, 21), 2),
-            'mars_base_internal_humidity': round(random.uniform(50, 60), 2),
-            'mars_base_external_illuminance': round(random.uniform(500, 715), 2),
-            'mars_base_internal_co2': round(random.uniform(0.02, 0.1), 2),
-            'mars_base_internal_oxygen': round(random.uniform(4, 7), 2),
+            'mars_base_internal_temperature': round(uniform(18, 30), 2),
+            'mars_base_external_temperature': round(uniform(0, 21), 2),
+            'mars_base_internal_humidity': round(uniform(50, 60), 2),
+            'mars_base_external_illuminance': round(uniform(500, 715), 2),
+            'mars_base_internal_co2': round(uniform(0.02, 0.1), 2),
+            'mars_base_internal_oxygen': round(uniform(4, 7), 2),
         })
 
-    def log_env(self, timestamp):
-        """환경 데이터를 로그 파일에 기록"""
+    def generate_batch(self, count):
+        """count 개 샘플을 한꺼번에 만들어 환경 변수별 array('d') 로 반환
+
+        샘플마다 set_env 를 부르지 않고 열 단위로 값을 만든다. 소수점 둘째 자리 값만 나오므로
+        round 대신 0.01 단위 정수를 한 번에 뽑은 뒤 100 으로 나눈다.
+        """
+        batch = {}
+        for key, (low, high) in SENSOR_RANGES.items():
+            hundredths = range(round(low * 100), round(high * 100) + 1)
+            values = self.rng.choices(hundredths, k=count)
+            batch[key] = array('d', map(operator.truediv, values, itertools.repeat(100)))
+        return batch
+
+    def log_batch(self, batch, start=0, period=SAMPLE_PERIOD, chunk_size=10000):
+        """generate_batch 결과를 T+ 시각과 함께 chunk_size 개씩 묶어서 로그에 기록"""
+        columns = [batch[key] for key in SENSOR_RANGES]
+        count = len(columns[0]) if columns else 0
+        for first in range(0, count, chunk_size):
+            last = min(first + chunk_size, count)
+            timestamps = (f'T+{start + i * period} sec' for i in range(first, last))
+            chunk = [column[first:last] for column in columns]
+            self.log_sink.write(''.join(map(LOG_ENTRY_TEMPLATE.format, timestamps, *chunk)))
+
+    def log_env(self, timestamp, values=None):
+        """환경 데이터를 로그 파일에 기록 (values 를 주면 현재 값 대신 그 값을 기록)"""
+        values = self.env_values if values is None else values
         log_message = (
             f'[{timestamp}]\n'
-            f'내부 온도: {self.env_values["mars_base_internal_temperature"]:.2f}\n'
-            f'외부 온도: {self.env_values["mars_base_external_temperature"]:.2f}\n'
-            f'내부 습도: {self.env_values["mars_base_internal_humidity"]:.2f}\n'
-            f'외부 광량: {self.env_values["mars_base_external_illuminance"]:.2f}\n'
-            f'내부 CO2: {self.env_values["mars_base_internal_co2"]:.2f}\n'
-            f'내부 산소: {self.env_values["mars_base_internal_oxygen"]:.2f}\n\n'
+            f'내부 온도: {values["mars_base_internal_temperature"]:.2f}\n'
+            f'외부 온도: {values["mars_base_external_temperature"]:.2f}\n'
+            f'내부 습도: {values["mars_base_internal_humidity"]:.2f}\n'
+            f'외부 광량: {values["mars_base_external_illuminance"]:.2f}\n'
+            f'내부 CO2: {values["mars_base_internal_co2"]:.2f}\n'
+            f'내부 산소: {values["mars_base_internal_oxygen"]:.2f}\n\n'
+        )
+        self.log_sink.write(log_message)
+
+class TelemetryWriter:
+    """환경 데이터를 고정 길이 이진 레코드로 기록하는 클래스
+
+    파일은 머리말(스키마) 뒤에 sync_interval 개 레코드마다 동기화 표식을 두고,
+    각 레코드는 시각(float64) 하나와 항목별 값(float32 또는 float64)으로 이루어진다.
+    모든 길이가 고정이라 n 번째 레코드의 위치를 계산으로 바로 찾을 수 있다.
+    """
+    def __init__(self, path=TELEMETRY_FILE_PATH, fields=tuple(SENSOR_RANGES), typecode='f',
+                 sync_interval=TELEMETRY_SYNC_INTERVAL):
+        if typecode not in ('f', 'd'):
+            raise ValueError("typecode 는 'f' 또는 'd' 이어야 합니다.")
+        if sync_interval <= 0:
+            raise ValueError('sync_interval 은 0보다 커야 합니다.')
+        self.fields = tuple(fields)
+        self.sync_interval = sync_interval
+        self.count = 0
+        self._record = struct.Struct('<d' + typecode * len(self.fields))
+        names = '\n'.join(self.fields).encode('utf-8')
+        padding = -(_TELEMETRY_HEADER.size + len(names)) % 8  # 레코드를 8바이트 경계에 맞춤
+        self._file = open(path, 'wb')
+        self._file.write(
+            _TELEMETRY_HEADER.pack(
+                TELEMETRY_MAGIC,
+                TELEMETRY_VERSION,
+                typecode.encode('ascii'),
+                len(self.fields),
+                sync_interval,
+                len(names),
+            )
+            + names
+            + bytes(padding)
         )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, timestamp, values):
+        """레코드 하나 기록 (values 는 환경 변수 이름을 키로 하는 딕셔너리)"""
+        self.write_rows([(timestamp, *(values[key] for key in self.fields))])
+
+    def write_rows(self, rows):
+        """(시각, 값...) 튜플들을 차례로 기록하고 필요한 자리에 동기화 표식을 넣음"""
+        pack = self._record.pack
+        chunk = []
+        for row in rows:
+            if self.count % self.sync_interval == 0:
+                chunk.append(_TELEMETRY_SYNC.pack(TELEMETRY_SYNC_MAGIC, self.count))
+            chunk.append(pack(*row))
+            self.count += 1
+            if len(chunk) >= self.sync_interval:
+                self._file.write(b''.join(chunk))
+                chunk.clear()
+        self._file.write(b''.join(chunk))
+
+    def write_batch(self, batch, start=0, period=SAMPLE_PERIOD):
+        """DummySensor.generate_batch 결과를 T+ 시각과 함께 기록"""
+        columns = [batch[key] for key in self.fields]
+        count = len(columns[0]) if columns else 0
+        timestamps = (start + i * period for i in range(count))
+        self.write_rows(zip(timestamps, *columns))
+
+
+class TelemetryReader:
+    """TelemetryWriter 가 만든 파일을 mmap 으로 열어 레코드를 읽는 클래스
+
+    레코드는 (시각, 값...) 튜플로 돌려준다. 시각이 기록 순서대로 커진다고 보고
+    find_range 는 이진 탐색으로 구간을 찾는다. 동기화 표식이 어긋나면 ValueError 를 낸다.
+    """
+    def __init__(self, path=TELEMETRY_FILE_PATH):
+        self._file = open(path, 'rb')
         try:
-            with open(LOG_FILE_PATH, 'a') as log_file:
-                log_file.write(log_message)
-        except IOError as e:
-            print(f'파일을 쓸 때 오류가 발생했습니다: {e}')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f'빈 텔레메트리 파일입니다: {path}')
+        try:
+            magic, version, typecode, field_count, sync_interval, names_length = (
+                _TELEMETRY_HEADER.unpack_from(self._mmap)
+            )
+            if magic != TELEMETRY_MAGIC or version != TELEMETRY_VERSION:
+                raise ValueError(f'텔레메트리 파일 형식이 아닙니다: {path}')
+        except (struct.error, ValueError):
+            self.close()
+            raise
+        names_end = _TELEMETRY_HEADER.size + names_length
+        names = bytes(self._mmap[_TELEMETRY_HEADER.size:names_end]).decode('utf-8')
+        self.fields = tuple(names.split('\n'))
+        self.typecode = typecode.decode('ascii')
+        self.sync_interval = sync_interval
+        self._record = struct.Struct('<d' + self.typecode * field_count)
+        self._data_start = names_end + (-names_end % 8)
+        self._group_size = _TELEMETRY_SYNC.size + sync_interval * self._record.size
+
+        # 마지막 묶음이 중간에 잘렸으면 온전한 레코드까지만 셈
+        groups, rest = divmod(len(self._mmap) - self._data_start, self._group_size)
+        self._count = groups * sync_interval
+        if rest > _TELEMETRY_SYNC.size:
+            self._count += (rest - _TELEMETRY_SYNC.size) // self._record.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+    def __len__(self):
+        return self._count
+
+    def _offset(self, index):
+        group, position = divmod(index, self.sync_interval)
+        return (
+            self._data_start + group * self._group_size
+            + _TELEMETRY_SYNC.size + position * self._record.size
+        )
+
+    def _check_sync(self, group):
+        offset = self._data_start + group * self._group_size
+        magic, first = _TELEMETRY_SYNC.unpack_from(self._mmap, offset)
+        if magic != TELEMETRY_SYNC_MAGIC or first != group * self.sync_interval:
+            raise ValueError(f'{offset} 위치의 동기화 표식이 올바르지 않습니다.')
+
+    def timestamp(self, index):
+        return _TIMESTAMP.unpack_from(self._mmap, self._offset(index))[0]
+
+    def record(self, index):
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._record.unpack_from(self._mmap, self._offset(index))
+
+    def records(self, start=0, stop=None):
+        """start 부터 stop 앞까지 레코드를 동기화 묶음 단위로 한꺼번에 풀어서 반환
+
+        묶음마다 mmap 에서 바이트를 복사해 풀므로, 다 읽지 않은 제너레이터가 남아 있어도
+        close() 할 수 있다.
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        while start < stop:
+            group = start // self.sync_interval
+            self._check_sync(group)
+            end = min((group + 1) * self.sync_interval, stop)
+            first = self._offset(start)
+            yield from self._record.iter_unpack(self._mmap[first:first + (end - start) * self._record.size])
+            start = end
+
+    def _first_at_or_after(self, timestamp):
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find_range(self, low, high=float('inf')):
+        """시각이 low 이상 high 미만인 레코드의 (시작 번호, 끝 번호)"""
+        return self._first_at_or_after(low), self._first_at_or_after(high)
+
+    def iter_range(self, low, high=float('inf')):
+        return self.records(*self.find_range(low, high))
+
+
+def _decode_log_line(raw, encoding):
+    if encoding is not None:
+        return raw.decode(encoding, errors='replace')
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode(LOG_FALLBACK_ENCODING, errors='replace')
+
+
+def parse_text_log(path=LOG_FILE_PATH, encoding=None):
+    """텍스트 로그를 읽어 (시각, {환경 변수: 값}) 을 차례로 반환
+
+    [T+n sec] 줄의 n 을 시각으로 쓰고, 그 뒤의 한글 항목 줄을 값으로 모은다.
+    run_sensors 가 남긴 '[센서 이름 T+n sec]' 형식도 시각만 읽는다.
+    encoding 을 주지 않으면 줄마다 UTF-8 로 읽어 보고 안 되면 cp949 로 읽는다.
+    숫자로 읽을 수 없는 값이 있는 항목은 건너뛴다.
+    """
+    timestamp_pattern = re.compile(LOG_TIMESTAMP_PATTERN)
+    timestamp = None
+    values = {}
+    with open(path, 'rb') as file:
+        for raw in file:
+            line = _decode_log_line(raw, encoding).strip()
+            if line.startswith('['):
+                match = timestamp_pattern.search(line)
+                try:
+                    timestamp = float(match.group(1)) if match else None
+                except ValueError:
+                    timestamp = None
+                values = {}
+            elif line and timestamp is not None:
+                label, _, value = line.partition(': ')
+                key = LOG_LABELS.get(label)
+                if key is None:
+                    continue
+                try:
+                    values[key] = float(value)
+                except ValueError:
+                    timestamp = None  # 깨진 항목은 다음 [T+n sec] 줄까지 버림
+                    continue
+                if len(values) == len(LOG_LABELS):
+                    yield timestamp, values
+                    timestamp = None
+
+
+def convert_text_log(text_path=LOG_FILE_PATH, binary_path=TELEMETRY_FILE_PATH, typecode='f',
+                     encoding=None):
+    """텍스트 로그를 텔레메트리 이진 파일로 변환하고 변환한 레코드 수를 반환
+
+    임시 파일에 쓴 뒤 바꿔 끼우므로 변환 중에 실패해도 기존 binary_path 는 그대로 남는다.
+    """
+    fields = tuple(LOG_LABELS.values())
+    temp_path = f'{binary_path}.tmp'
+    try:
+        with TelemetryWriter(temp_path, fields, typecode) as writer:
+            writer.write_rows(
+                (timestamp, *(values[key] for key in fields))
+                for timestamp, values in parse_text_log(text_path, encoding)
+            )
+        os.replace(temp_path, binary_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return writer.count
+
+
+class RollingStats:
+    """최근 window 개 값의 평균, 분산, 최솟값, 최댓값, 백분위수를 관리하는 클래스
+
+    링 버퍼와 누적 합으로 평균과 분산을, 단조 덱으로 최솟값과 최댓값을 상수 시간에 갱신한다.
+    low, high 를 주면 그 범위를 resolution 간격으로 나눈 히스토그램을 함께 유지해서
+    백분위수도 상수 시간에 갱신하고 조회할 때 구간 수만큼만 훑는다. 센서 값은 0.01 단위라
+    이 경우 결과가 정확하다. 범위를 주지 않았거나 격자를 벗어난 값이 창 안에 있으면
+    백분위수는 조회할 때 버퍼를 정렬해서 계산한다.
+    """
+    def __init__(self, window, low=None, high=None, resolution=0.01):
+        if window < 1:
+            raise ValueError('window 는 1 이상이어야 합니다.')
+        self.window = window
+        self._values = array('d', bytes(8 * window))
+        self._min_queue = deque()  # (순번, 값), 값이 증가하는 순서
+        self._max_queue = deque()  # (순번, 값), 값이 감소하는 순서
+        self._count = 0
+        self._next = 0
+        self._seq = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._bins = None
+        self._off_grid = 0  # 히스토그램에 넣지 못한 값의 개수
+        if low is not None and high is not None:
+            # 격자 값은 정수 / scale 로 나타내서 generate_batch 나 round(x, 2) 의 값과 똑같이 만듦
+            self._scale = round(1 / resolution)
+            self._base = round(low * self._scale)
+            self._bins = array('l', bytes(8 * (round(high * self._scale) - self._base + 1)))
+
+    def __len__(self):
+        return self._count
+
+    def _bin(self, value):
+        """value 가 들어갈 히스토그램 구간 번호 (격자 위의 값이 아니면 None)"""
+        step = round(value * self._scale)
+        index = step - self._base
+        if 0 <= index < len(self._bins) and step / self._scale == value:
+            return index
+        return None
+
+    def add(self, value):
+        """새 값을 넣고 창을 벗어난 가장 오래된 값을 뺌"""
+        if self._count == self.window:
+            old = self._values[self._next]
+            self._sum -= old
+            self._sum_sq -= old * old
+            if self._bins is not None:
+                index = self._bin(old)
+                if index is None:
+                    self._off_grid -= 1
+                else:
+                    self._bins[index] -= 1
+        else:
+            self._count += 1
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.window
+        self._sum += value
+        self._sum_sq += value * value
+        if self._bins is not None:
+            index = self._bin(value)
+            if index is None:
+                self._off_grid += 1
+            else:
+                self._bins[index] += 1
+
+        seq = self._seq
+        self._seq += 1
+        while self._min_queue and self._min_queue[-1][1] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((seq, value))
+        while self._max_queue and self._max_queue[-1][1] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((seq, value))
+        expired = seq - self.window
+        if self._min_queue[0][0] <= expired:
+            self._min_queue.popleft()
+        if self._max_queue[0][0] <= expired:
+            self._max_queue.popleft()
+
+        # 누적 합의 부동소수점 오차가 쌓이지 않도록 버퍼가 한 바퀴 돌 때마다 다시 계산
+        if self._next == 0 and self._count == self.window:
+            self._sum = sum(self._values)
+            self._sum_sq = sum(v * v for v in self._values)
+
+    def mean(self):
+        return self._sum / self._count if self._count else 0.0
+
+    def variance(self):
+        """모분산"""
+        if not self._count:
+            return 0.0
+        mean = self._sum / self._count
+        return max(0.0, self._sum_sq / self._count - mean * mean)
+
+    def min(self):
+        return self._min_queue[0][1] if self._count else 0.0
+
+    def max(self):
+        return self._max_queue[0][1] if self._count else 0.0
+
+    def _ranked(self):
+        """크기 순서 r 번째 값을 돌려주는 함수"""
+        if self._bins is not None and not self._off_grid:
+            cumulative = list(itertools.accumulate(self._bins))
+            return lambda rank: (
+                (self._base + bisect.bisect_right(cumulative, rank)) / self._scale
+            )
+        if self._count == self.window:
+            values = sorted(self._values)
+        else:
+            values = sorted(self._values[:self._count])
+        return values.__getitem__
+
+    def percentile(self, percent, ranked=None):
+        """선형 보간 백분위수 (percent 는 0~100)"""
+        if not self._count:
+            return 0.0
+        ranked = ranked or self._ranked()
+        position = (self._count - 1) * percent / 100
+        lower = int(position)
+        upper = min(lower + 1, self._count - 1)
+        fraction = position - lower
+        return ranked(lower) * (1 - fraction) + ranked(upper) * fraction
+
+    def summary(self):
+        ranked = self._ranked() if self._count else None
+        return {
+            'mean': self.mean(),
+            'variance': self.variance(),
+            'min': self.min(),
+            'max': self.max(),
+            'p50': self.percentile(50, ranked),
+            'p95': self.percentile(95, ranked),
+        }
+
+
+class WindowStats:
+    """환경 변수별 RollingStats 를 묶어서 한 구간의 통계를 관리하는 클래스
+
+    ranges 에 {키: (최솟값, 최댓값)} 을 주면 그 키는 히스토그램으로 백분위수를 관리한다.
+    """
+    def __init__(self, keys, window, ranges=None):
+        ranges = ranges or {}
+        self.window = window
+        self.stats = {key: RollingStats(window, *ranges.get(key, (None, None))) for key in keys}
+
+    def __len__(self):
+        return len(next(iter(self.stats.values()))) if self.stats else 0
+
+    def add(self, sample):
+        for key, stats in self.stats.items():
+            stats.add(sample[key])
+
+    def means(self):
+        return {key: stats.mean() for key, stats in self.stats.items()}
+
+    def summary(self):
+        return {key: stats.summary() for key, stats in self.stats.items()}
+
+
+class SampleView(Mapping):
+    """SampleStore 의 샘플 하나를 dict 처럼 읽는 뷰 (복사하려면 dict(view))
+
+    링 버퍼의 칸을 가리키므로 저장소가 한 바퀴 돌아 그 칸을 덮어쓰면 값도 바뀐다.
+    """
+    __slots__ = ('_store', '_position')
+
+    def __init__(self, store, position):
+        self._store = store
+        self._position = position
+
+    def __getitem__(self, key):
+        return self._store._columns[self._store._column_index[key]][self._position]
+
+    def __iter__(self):
+        return iter(self._store.schema)
+
+    def __len__(self):
+        return len(self._store.schema)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class SampleStore:
+    """고정 스키마 샘플을 열별 array 링 버퍼에 저장하는 클래스
+
+    샘플마다 dict 를 복사하는 대신 값 하나에 8바이트(typecode='f' 이면 4바이트)만 쓴다.
+    """
+    def __init__(self, schema, capacity, typecode='d'):
+        if capacity < 1:
+            raise ValueError('capacity 는 1 이상이어야 합니다.')
+        self.schema = tuple(schema)
+        self.capacity = capacity
+        self._column_index = {key: i for i, key in enumerate(self.schema)}
+        item_size = array(typecode).itemsize
+        self._columns = [array(typecode, bytes(item_size * capacity)) for _ in self.schema]
+        self._start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, sample):
+        """샘플을 추가, 가득 차면 가장 오래된 샘플을 덮어씀"""
+        if self._count < self.capacity:
+            position = (self._start + self._count) % self.capacity
+            self._count += 1
+        else:
+            position = self._start
+            self._start = (self._start + 1) % self.capacity
+        for column, key in zip(self._columns, self.schema):
+            column[position] = sample[key]
+
+    def _position(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('샘플 번호가 범위를 벗어났습니다.')
+        return (self._start + index) % self.capacity
+
+    def __getitem__(self, index):
+        """index 번째(0 이 가장 오래된) 샘플의 뷰"""
+        return SampleView(self, self._position(index))
+
+    def __iter__(self):
+        """오래된 샘플부터 뷰를 차례로 내보냄"""
+        for index in range(self._count):
+            yield SampleView(self, (self._start + index) % self.capacity)
+
+    def column(self, key):
+        """한 환경 변수의 값을 오래된 순서대로 array 로 반환"""
+        column = self._columns[self._column_index[key]]
+        end = self._start + self._count
+        if end <= self.capacity:
+            return column[self._start:end]
+        return column[self._start:] + column[:end - self.capacity]
+
+    def nbytes(self):
+        """값 저장에 쓰는 메모리(바이트)"""
+        return sum(column.itemsize * len(column) for column in self._columns)
+
+
+class FixedRateTicker:
+    """시작 시각 + n * period 라는 절대 마감 시각에 맞춰 깨어나는 고정 주기 타이머
+
+    작업 시간과 관계없이 주기가 밀리지 않는다. 작업이 주기를 넘기면(overrun) 바로 다음 틱을
+    실행하고, 한 주기 이상 늦어서 지나가 버린 틱은 건너뛰고 그 수를 센다.
+    clock 과 sleep 을 바꿔 끼우면 가상 시계로 빠르게 시험할 수 있다.
+    """
+    def __init__(self, period, clock=time.monotonic, sleep=time.sleep):
+        if period <= 0:
+            raise ValueError('period 는 0보다 커야 합니다.')
+        self.period = period
+        self.clock = clock
+        self.sleep = sleep
+        self.start = None
+        self.next_tick = 0
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped_ticks = 0
+        self.jitter_sum = 0.0
+        self.jitter_max = 0.0
+
+    def wait(self):
+        """다음 틱의 마감 시각까지 대기한 뒤 틱 번호(0부터)를 반환"""
+        now = self.clock()
+        if self.start is None:
+            self.start = now
+        deadline = self.start + self.next_tick * self.period
+        late = now - deadline
+        if late > 0 and self.ticks:
+            self.overruns += 1
+            missed = int(late // self.period)
+            if missed:
+                self.skipped_ticks += missed
+                self.next_tick += missed
+                deadline += missed * self.period
+        elif late < 0:
+            self.sleep(-late)
+            now = self.clock()
+
+        jitter = now - deadline
+        self.jitter_sum += abs(jitter)
+        self.jitter_max = max(self.jitter_max, abs(jitter))
+        self.ticks += 1
+        tick = self.next_tick
+        self.next_tick += 1
+        return tick
+
+    def metrics(self):
+        """지터(마감 시각과 실제 깨어난 시각의 차이)와 overrun 통계"""
+        return {
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'skipped_ticks': self.skipped_ticks,
+            'jitter_mean': self.jitter_sum / self.ticks if self.ticks else 0.0,
+            'jitter_max': self.jitter_max,
+        }
+
+
+class SensorReading:
+    """센서 측정값 하나 (센서 이름, 측정 순번, 측정 시각, 값)"""
+    __slots__ = ('name', 'tick', 'timestamp', 'values')
+
+    def __init__(self, name, tick, timestamp, values):
+        self.name = name
+        self.tick = tick
+        self.timestamp = timestamp  # 스케줄러 시작 후 경과 시간(초, 단조 시계 기준)
+        self.values = values
+
+
+class SensorScheduler:
+    """여러 센서를 각자의 주기로 하나의 asyncio 루프에서 샘플링하는 스케줄러
+
+    각 센서의 n 번째 측정은 시작 시각 + n * 주기 라는 절대 시각에 맞춰 실행되므로
+    처리 시간이 쌓여도 주기가 밀리지 않는다. 측정값은 큐에 넣기만 하고
+    로그 기록과 출력 같은 느린 처리는 별도 스레드의 핸들러가 맡는다.
+    """
+    def __init__(self, queue_size=100000):
+        self.sensors = []
+        self.handlers = []
+        self.readings = queue.Queue(maxsize=queue_size)
+        self.sample_count = 0
+        self.dropped_count = 0
+        self._start = 0.0
+
+    def add_sensor(self, name, sensor, period):
+        """set_env() 와 env_values 를 가진 센서를 period 초 주기로 등록"""
+        if period <= 0:
+            raise ValueError('period 는 0보다 커야 합니다.')
+        self.sensors.append((name, sensor, period))
+
+    def add_handler(self, handler):
+        """측정값(SensorReading)을 받을 함수를 등록, 샘플링과 다른 스레드에서 호출됨"""
+        self.handlers.append(handler)
+
+    async def _sample(self, name, sensor, period):
+        loop = asyncio.get_running_loop()
+        tick = 0
+        while True:
+            delay = self._start + tick * period - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # 밀린 경우에도 다른 센서가 돌 수 있도록 양보
+                await asyncio.sleep(0)
+            sensor.set_env()
+            reading = SensorReading(name, tick, loop.time() - self._start, dict(sensor.env_values))
+            try:
+                self.readings.put_nowait(reading)
+                self.sample_count += 1
+            except queue.Full:
+                self.dropped_count += 1
+            tick += 1
+
+    def _dispatch(self):
+        # 핸들러 스레드: 큐에서 측정값을 꺼내 핸들러에 전달, None 을 받으면 종료
+        while True:
+            reading = self.readings.get()
+            if reading is None:
+                return
+            for handler in self.handlers:
+                try:
+                    handler(reading)
+                except Exception as e:
+                    print(f'측정값 처리 중 오류 발생: {e}')
+
+    async def run(self, duration=None):
+        """duration 초 동안(없으면 취소될 때까지) 모든 센서를 샘플링"""
+        loop = asyncio.get_running_loop()
+        dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        dispatcher.start()
+        self._start = loop.time()
+        tasks = [
+            asyncio.create_task(self._sample(name, sensor, period))
+            for name, sensor, period in self.sensors
+        ]
+        try:
+            if duration is None:
+                await asyncio.gather(*tasks)
+            else:
+                await asyncio.sleep(duration)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # 큐에 남은 측정값까지 처리한 뒤 핸들러 스레드 종료
+            self.readings.put(None)
+            await loop.run_in_executor(None, dispatcher.join)
+
+
+class SampleSerializer:
+    """딕셔너리 하나를 NDJSON 한 줄이나 msgpack 맵 하나로 직렬화해 버퍼에 모았다가 내보내는 클래스
+
+    키는 처음 한 번만 인코딩해 캐시에 두고, 값이 모두 실수인 키 조합은 키를 미리 넣어 둔
+    틀에 값만 채운다. 실수는 print_json 처럼 소수점 둘째 자리까지 쓰고,
+    JSON 으로 표현할 수 없는 nan, inf 는 null 로 쓴다.
+    stream 은 바이너리 스트림이며 주지 않으면 표준 출력을 쓴다.
+    """
+    def __init__(self, output_format='ndjson', stream=None, flush_interval=OUTPUT_FLUSH_INTERVAL,
+                 max_buffer_size=OUTPUT_BUFFER_SIZE):
+        if output_format not in ('ndjson', 'msgpack'):
+            raise ValueError(f'지원하지 않는 출력 형식입니다: {output_format}')
+        self.output_format = output_format
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self._encode = self._encode_json if output_format == 'ndjson' else self._encode_msgpack
+        self._keys = {}
+        self._templates = {}  # 키 조합(튜플): 미리 만든 직렬화 틀
+        self._buffer = []
+        self._buffer_size = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._registered = False
+
+    def write(self, data, title=''):
+        """data 를 한 레코드로 직렬화해 버퍼에 추가 (title 이 있으면 {"title", "data"} 로 감쌈)"""
+        record = self._encode(data, title)
+        with self._lock:
+            if not self._registered:
+                atexit.register(self.close)  # 종료할 때 남은 버퍼를 내보냄, close() 에서 해제
+                self._registered = True
+            self._buffer.append(record)
+            self._buffer_size += len(record)
+            if (
+                self._buffer_size >= self.max_buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
+            elif self._timer is None:
+                # 다음 write 가 없어도 flush_interval 안에 내보내도록 타이머를 걸어 둠
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+            self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """남은 버퍼를 내보내고 타이머와 종료 처리 등록을 해제"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._flush_locked()
+            if self._registered:
+                atexit.unregister(self.close)
+                self._registered = False
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        stream = self.stream
+        if stream is None:
+            # print 로 쓴 내용이 먼저 나가도록 텍스트 계층을 비운 뒤 바이트를 바로 씀
+            sys.stdout.flush()
+            stream = sys.stdout.buffer
+        stream.write(b''.join(self._buffer))
+        stream.flush()
+        self._buffer.clear()
+        self._buffer_size = 0
+
+    def _fragment(self, key):
+        """키의 인코딩 결과를 캐시에서 찾고, 없으면 한 번만 인코딩"""
+        fragment = self._keys.get(key)
+        if fragment is None:
+            if self.output_format == 'ndjson':
+                fragment = _json_string(str(key))
+            else:
+                fragment = self._msgpack_str(key)
+            self._keys[key] = fragment
+        return fragment
+
+    def _json_value(self, value):
+        if value is None or isinstance(value, bool):
+            return 'null' if value is None else ('true' if value else 'false')
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, float):
+            return f'{value:.2f}' if math.isfinite(value) else 'null'
+        return _json_string(str(value))
+
+    def _json_template(self, data):
+        """값이 모두 실수인 키 조합이면 키를 미리 넣어 둔 str.format 틀을 만듦 (아니면 None)"""
+        if not _FLOAT_TYPES.issuperset(map(type, data.values())):
+            return None
+        fields = (
+            _json_string(str(key)).replace('{', '{{').replace('}', '}}') + ':{:.2f}'
+            for key in data
+        )
+        return '{{' + ','.join(fields) + '}}'
+
+    def _encode_json(self, data, title):
+        keys = tuple(data)
+        if keys not in self._templates:
+            self._templates[keys] = self._json_template(data)
+        template = self._templates[keys]
+        values = data.values()
+        # 모두 실수이고 합이 유한하면 nan, inf 가 없으므로 틀에 값만 채우면 됨
+        if (
+            template is not None
+            and _FLOAT_TYPES.issuperset(map(type, values))
+            and math.isfinite(sum(values))
+        ):
+            body = template.format(*values)
+        else:
+            fragment = self._fragment
+            body = '{' + ','.join(
+                fragment(key) + ':' + self._json_value(value) for key, value in data.items()
+            ) + '}'
+        if title:
+            # 제목은 run_sensors 처럼 매번 달라질 수 있으므로 캐시하지 않음
+            body = f'{{"title":{_json_string(str(title))},"data":{body}}}'
+        return (body + '\n').encode('utf-8')
+
+    @staticmethod
+    def _msgpack_str(text):
+        raw = str(text).encode('utf-8')
+        if len(raw) < 32:
+            return bytes((0xa0 | len(raw),)) + raw
+        if len(raw) < 0x100:
+            return bytes((0xd9, len(raw))) + raw
+        if len(raw) < 0x10000:
+            return b'\xda' + len(raw).to_bytes(2, 'big') + raw
+        return b'\xdb' + len(raw).to_bytes(4, 'big') + raw
+
+    @staticmethod
+    def _msgpack_map_header(size):
+        if size < 16:
+            return bytes((0x80 | size,))
+        return b'\xde' + size.to_bytes(2, 'big')
+
+    def _msgpack_value(self, value):
+        if value is None:
+            return b'\xc0'
+        if isinstance(value, bool):
+            return b'\xc3' if value else b'\xc2'
+        if isinstance(value, int):
+            return bytes((value,)) if 0 <= value < 0x80 else _MSGPACK_INT.pack(0xd3, value)
+        if isinstance(value, float):
+            return _MSGPACK_FLOAT.pack(0xcb, value)
+        return self._msgpack_str(value)
+
+    def _msgpack_template(self, data):
+        """값이 모두 실수인 키 조합이면 (맵 머리, 키 + float64 표식 조각들) 을 만듦 (아니면 None)"""
+        if not _FLOAT_TYPES.issuperset(map(type, data.values())):
+            return None
+        return (
+            self._msgpack_map_header(len(data)),
+            tuple(self._fragment(key) + b'\xcb' for key in data),
+        )
+
+    def _encode_msgpack(self, data, title):
+        keys = tuple(data)
+        if keys not in self._templates:
+            self._templates[keys] = self._msgpack_template(data)
+        template = self._templates[keys]
+        values = data.values()
+        if template is not None and _FLOAT_TYPES.issuperset(map(type, values)):
+            header, prefixes = template
+            body = header + b''.join(map(operator.add, prefixes, map(_FLOAT64.pack, values)))
+        else:
+            fragment = self._fragment
+            parts = [self._msgpack_map_header(len(data))]
+            for key, value in data.items():
+                parts.append(fragment(key))
+                parts.append(self._msgpack_value(value))
+            body = b''.join(parts)
+        if title:
+            body = b'\x82' + self._fragment('title') + self._msgpack_str(title) + self._fragment('data') + body
+        return body
+
+
+class LoadSampler:
+    """백그라운드 스레드에서 시스템 부하를 주기적으로 측정해 최신 스냅숏을 보관하는 클래스
+
+    psutil.cpu_percent(interval=1) 처럼 호출한 쪽을 1초씩 붙잡지 않고, 측정은 스레드가
+    FixedRateTicker 주기로 하고 읽는 쪽은 이미 만들어 둔 딕셔너리를 가져가기만 한다.
+    디스크와 네트워크는 누적 카운터의 차이를 경과 시간으로 나눈 초당 바이트로 기록한다.
+    """
+    def __init__(self, interval=LOAD_SAMPLE_INTERVAL, history_size=LOAD_HISTORY_SIZE):
+        self.interval = interval
+        self.history = deque(maxlen=history_size)
+        self._snapshot = None
+        self._ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._last_time = None
+        self._last_disk = None
+        self._last_net = None
+
+    def start(self):
+        """측정 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        # 첫 호출은 기준점만 잡고 0.0 을 돌려주므로 미리 한 번 호출해 둠
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._last_time = time.monotonic()
+        self._last_disk = psutil.disk_io_counters()
+        self._last_net = psutil.net_io_counters()
+        self._thread = threading.Thread(target=self._run, name='load-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """측정 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        ticker = FixedRateTicker(self.interval, sleep=self._stop_event.wait)
+        ticker.wait()  # 0번 틱은 start() 에서 잡은 기준점
+        while not self._stop_event.is_set():
+            ticker.wait()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.sample()
+            except Exception as e:
+                print(f'부하 정보를 측정하는 중 오류 발생: {e}')
+
+    @staticmethod
+    def _rate(current, last, field, elapsed):
+        if current is None or last is None or elapsed <= 0:
+            return 0.0
+        return max(getattr(current, field) - getattr(last, field), 0) / elapsed
+
+    def sample(self):
+        """부하를 한 번 측정해 스냅숏과 히스토리를 갱신하고 스냅숏을 반환"""
+        now = time.monotonic()
+        per_core = tuple(psutil.cpu_percent(interval=None, percpu=True))
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        elapsed = now - self._last_time if self._last_time is not None else 0.0
+
+        snapshot = {
+            'timestamp': now,
+            'cpu_usage_percent': sum(per_core) / len(per_core) if per_core else 0.0,
+            'cpu_per_core_percent': per_core,
+            'memory_usage_percent': memory.percent,
+            'memory_used_mb': round(memory.used / (1024 * 1024), 2),
+            'disk_read_bytes_per_sec': self._rate(disk, self._last_disk, 'read_bytes', elapsed),
+            'disk_write_bytes_per_sec': self._rate(disk, self._last_disk, 'write_bytes', elapsed),
+            'net_sent_bytes_per_sec': self._rate(net, self._last_net, 'bytes_sent', elapsed),
+            'net_recv_bytes_per_sec': self._rate(net, self._last_net, 'bytes_recv', elapsed),
+        }
+        self._last_time, self._last_disk, self._last_net = now, disk, net
+        # 딕셔너리를 통째로 바꿔 끼우므로 읽는 쪽은 잠금 없이 항상 완성된 스냅숏을 봄
+        self._snapshot = snapshot
+        self.history.append(snapshot)
+        self._ready.set()
+        return snapshot
+
+    def snapshot(self, timeout=None):
+        """최신 스냅숏 반환 (첫 측정 전이면 timeout 초까지 기다리고, 그래도 없으면 None)"""
+        if self._snapshot is None:
+            self._ready.wait(timeout)
+        return self._snapshot
+
+    def trend(self, key, count=None):
+        """히스토리에서 key 값만 오래된 순서로 반환 (count 가 있으면 최근 count 개)"""
+        history = list(self.history)
+        if count is not None:
+            history = history[-count:]
+        return [snapshot[key] for snapshot in history]
+
+
+class SettingsCache:
+    """setting.txt 를 mtime 이 바뀔 때만 다시 읽고, 켜진 항목을 튜플로 미리 만들어 두는 클래스
+
+    mtime 확인도 check_interval 초에 한 번만 하므로 그 사이의 호출은 파일 시스템에 접근하지 않는다.
+    """
+    def __init__(self, path=SETTINGS_FILE_PATH, defaults=DEFAULT_SETTINGS,
+                 check_interval=SETTINGS_CHECK_INTERVAL, clock=time.monotonic):
+        self.path = path
+        self.defaults = dict(defaults)
+        self.check_interval = check_interval
+        self.clock = clock
+        self.settings = dict(self.defaults)
+        self.selected = tuple(key for key, enabled in self.settings.items() if enabled)
+        self._version = None  # 마지막으로 읽은 파일의 (mtime, 크기), 파일이 없으면 'missing'
+        self._next_check = None
+
+    def refresh(self):
+        """확인 간격이 지났고 파일이 바뀌었으면 다시 읽음, 다시 읽었으면 True"""
+        now = self.clock()
+        if self._next_check is not None and now < self._next_check:
+            return False
+        self._next_check = now + self.check_interval
+        try:
+            stat = os.stat(self.path)
+            version = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            version = 'missing'
+        if version == self._version:
+            return False
+        self._version = version
+        self._load(version == 'missing')
+        return True
+
+    def _load(self, missing):
+        settings = dict(self.defaults)
+        if missing:
+            print('setting.txt 파일이 없습니다. 기본 설정을 사용합니다.')
+        else:
+            try:
+                with open(self.path, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line or line.startswith('#'):
+                            continue
+                        key, value = line.split('=')
+                        settings[key.strip()] = value.strip().lower() == 'true'
+            except Exception as e:
+                print(f'setting.txt 로드 중 오류 발생: {e}')
+        self.settings = settings
+        self.selected = tuple(key for key, enabled in settings.items() if enabled)
+
+    def get(self):
+        """현재 설정 딕셔너리 반환 (필요하면 다시 읽음)"""
+        self.refresh()
+        return self.settings
+
+    def filter(self, *sources):
+        """여러 정보 딕셔너리를 합친 뒤 켜진 항목만 설정 순서대로 골라 반환"""
+        self.refresh()
+        merged = {}
+        for source in sources:
+            merged.update(source)
+        return {key: merged[key] for key in self.selected if key in merged}
+
+
+def read_boot_id():
+    """현재 부팅 ID 반환 (리눅스가 아니거나 읽을 수 없으면 None)"""
+    try:
+        with open(BOOT_ID_PATH, 'r') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def probe_static_system_info():
+    """운영체계, CPU, 전체 메모리처럼 실행 중에 바뀌지 않는 시스템 정보를 직접 조사"""
+    return {
+        'operating_system': platform.system(),
+        'os_version': platform.release(),
+        'cpu_type': platform.processor() or 'unknown',  # 리눅스에서는 uname 을 실행함
+        'cpu_cores': os.cpu_count() or 0,
+        'memory_size_mb': round(psutil.virtual_memory().total / (1024 * 1024), 2),  # psutil로 정확한 메모리 크기
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_static_system_info(cache_path=SYSTEM_INFO_CACHE_PATH):
+    """정적 시스템 정보를 프로세스당 한 번만 조사해서 반환
+
+    cache_path 가 있으면 부팅 ID 와 함께 파일에 저장해 두고, 같은 부팅 안에서 다시 시작할 때는
+    조사하지 않고 파일에서 읽는다. 재부팅하면 부팅 ID 가 달라지므로 다시 조사한다.
+    """
+    boot_id = read_boot_id() if cache_path else None
+    if boot_id is not None:
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get('boot_id') == boot_id:
+                return cached['info']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    info = probe_static_system_info()
+    if boot_id is not None:
+        temp_path = f'{cache_path}.tmp'
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump({'boot_id': boot_id, 'info': info}, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)  # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 교체
+        except OSError as e:
+            print(f'시스템 정보 캐시를 저장하는 중 오류 발생: {e}')
+    return info
+
 
 class MissionComputer:
     """화성 미션 컴퓨터의 상태와 환경 데이터를 관리하는 클래스"""
-    def __init__(self):
+    def __init__(self, history_capacity=AVG_INTERVAL, output_format='text',
+                 system_info_cache=SYSTEM_INFO_CACHE_PATH):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f'지원하지 않는 출력 형식입니다: {output_format}')
         self.sensor = DummySensor()
+        # text 는 사람이 읽는 기존 출력, ndjson 과 msgpack 은 버퍼를 거쳐 한 줄(레코드)씩 출력
+        self.serializer = None if output_format == 'text' else SampleSerializer(output_format)
         self.running = True
-        self.data_history = []
+        self.data_history = SampleStore(self.sensor.env_values, history_capacity)
+        self.window_stats = {
+            name: WindowStats(self.sensor.env_values, window, SENSOR_RANGES)
+            for name, window in STATS_WINDOWS.items()
+        }
         self.iteration = 0
+        self.ticker = None
+        self.settings = SettingsCache()
+        self.system_info_cache = system_info_cache  # None 이면 파일에 저장하지 않고 메모리에만 캐시
+        self.load_sampler = LoadSampler()
 
     def print_json(self, data, title=''):
         """데이터를 JSON 형식으로 출력"""
-        if title:
-            print(f'{title}:')
-        print('{')
+        if self.serializer is not None:
+            self.serializer.write(data, title)
+            return
+        lines = [f'{title}:'] if title else []
+        lines.append('{')
         for i, (key, value) in enumerate(data.items()):
             comma = ',' if i < len(data) - 1 else ''
             if isinstance(value, (int, float)):
-                print(f'    "{key}": {value:.2f}{comma}')
+                lines.append(f'    "{key}": {value:.2f}{comma}')
             else:
-                print(f'    "{key}": "{value}"{comma}')
-        print('}')
+                # 따옴표나 역슬래시가 들어 있어도 올바른 JSON 이 되도록 이스케이프
+                lines.append(f'    "{key}": {_json_string(str(value))}{comma}')
+        lines.append('}')
+        print('\n'.join(lines))
 
-    def delay(self, seconds=5):
+    def delay(self, seconds=SAMPLE_PERIOD):
         """지정된 시간만큼 대기"""
         time.sleep(seconds)
 
-    def calculate_averages(self):
-        """5분 평균 계산"""
-        if not self.data_history:
+    def calculate_averages(self, window='5분'):
+        """구간 평균 계산 (누적 합을 쓰므로 구간 크기와 관계없이 상수 시간)"""
+        stats = self.window_stats[window]
+        if not len(stats):
             return {}
-        return {key: sum(item[key] for item in self.data_history) / len(self.data_history) for key in self.data_history[0]}
+        return stats.means()
+
+    def get_window_summary(self, window='5분'):
+        """구간별 평균, 분산, 최솟값, 최댓값, 중앙값, 95백분위수"""
+        return self.window_stats[window].summary()
 
     def update_data_history(self):
-        """데이터 히스토리 업데이트"""
-        self.data_history.append(self.sensor.env_values.copy())
-        if len(self.data_history) > AVG_INTERVAL:
-            self.data_history.pop(0)
+        """데이터 히스토리와 구간 통계 업데이트"""
+        sample = self.sensor.env_values
+        self.data_history.append(sample)
+        for stats in self.window_stats.values():
+            stats.add(sample)
 
     def get_sensor_data(self):
         """센서 데이터 수집 및 출력"""
         print('환경 출력 중... 종료하려면 Ctrl+C를 누르세요.')
+        self.ticker = FixedRateTicker(SAMPLE_PERIOD)
         try:
             while self.running:
-                timestamp = f'T+{self.iteration * 5} sec'
+                # 작업 시간을 뺀 나머지만 기다리므로 측정 시각이 실제 경과 시간과 어긋나지 않음
+                tick = self.ticker.wait()
+                timestamp = f'T+{tick * SAMPLE_PERIOD} sec'
                 self.sensor.set_env()
                 self.sensor.log_env(timestamp)
                 self.update_data_history()
@@ -101,30 +1393,61 @@ class MissionComputer:
 
                 if self.iteration % AVG_INTERVAL == 0:
                     averages = self.calculate_averages()
-                    print('\n5분 평균:')
-                    print('------------------')
-                    self.print_json(averages)
-                    print('------------------\n')
+                    if self.serializer is not None:
+                        self.print_json(averages, '5분 평균')
+                    else:
+                        print('\n5분 평균:')
+                        print('------------------')
+                        self.print_json(averages)
+                        print('------------------\n')
+
+                # 다음 측정까지 주기 하나를 쉬므로 이번 측정 결과는 바로 내보냄
+                if self.serializer is not None:
+                    self.serializer.flush()
+        except KeyboardInterrupt:
+            self.stop()
+
+    def run_sensors(self, sensors, duration=None, verbose=True):
+        """여러 센서를 asyncio 스케줄러로 동시에 샘플링
+
+        sensors 는 {이름: (센서, 주기초)} 형태이고, 측정값은 로그에 기록하고
+        verbose 이면 출력한다. self.sensor 의 측정값은 데이터 히스토리에도 반영한다.
+        """
+        scheduler = SensorScheduler()
+        for name, (sensor, period) in sensors.items():
+            scheduler.add_sensor(name, sensor, period)
 
-                self.delay()
+        def handle(reading):
+            sensor = sensors[reading.name][0]
+            if hasattr(sensor, 'log_env'):
+                sensor.log_env(f'{reading.name} T+{reading.timestamp:.3f} sec', reading.values)
+            if sensor is self.sensor:
+                self.data_history.append(reading.values)
+                for stats in self.window_stats.values():
+                    stats.add(reading.values)
+            if verbose:
+                self.print_json(reading.values, f'{reading.name} T+{reading.timestamp:.3f} sec')
+
+        scheduler.add_handler(handle)
+        try:
+            asyncio.run(scheduler.run(duration))
         except KeyboardInterrupt:
             self.stop()
+        return scheduler
 
     def stop(self):
         """시스템 종료"""
         self.running = False
+        self.load_sampler.stop()
+        self.sensor.log_sink.close()
+        if self.serializer is not None:
+            self.serializer.close()
         print('System stopped.')
 
     def get_mission_computer_info(self):
-        """시스템 정보 가져오기"""
+        """시스템 정보 가져오기 (처음 한 번만 조사하고 이후에는 캐시를 씀)"""
         try:
-            system_info = {
-                'operating_system': platform.system(),
-                'os_version': platform.release(),
-                'cpu_type': platform.processor() or 'unknown',
-                'cpu_cores': os.cpu_count() or 0,
-                'memory_size_mb': round(psutil.virtual_memory().total / (1024 * 1024), 2),  # psutil로 정확한 메모리 크기
-            }
+            system_info = dict(get_static_system_info(self.system_info_cache))
             self.print_json(system_info, '미션 컴퓨터 시스템 정보')
             return system_info
         except Exception as e:
@@ -132,11 +1455,20 @@ class MissionComputer:
             return {}
 
     def get_mission_computer_load(self):
-        """실시간 부하 정보 가져오기"""
+        """실시간 부하 정보 가져오기 (백그라운드 측정 스레드의 최신 스냅숏을 읽기만 함)"""
         try:
+            # 처음 부를 때만 측정 스레드를 켜고 첫 측정이 끝날 때까지 기다림
+            snapshot = self.load_sampler.start().snapshot(timeout=self.load_sampler.interval * 4)
+            if snapshot is None:
+                raise RuntimeError('부하 측정 스레드가 응답하지 않습니다.')
             load_info = {
-                'cpu_usage_percent': psutil.cpu_percent(interval=1),  # 1초 간격으로 CPU 사용량 측정
-                'memory_usage_percent': psutil.virtual_memory().percent,  # 메모리 사용량 퍼센트
+                'cpu_usage_percent': snapshot['cpu_usage_percent'],
+                'memory_usage_percent': snapshot['memory_usage_percent'],
+                'memory_used_mb': snapshot['memory_used_mb'],
+                'disk_read_bytes_per_sec': snapshot['disk_read_bytes_per_sec'],
+                'disk_write_bytes_per_sec': snapshot['disk_write_bytes_per_sec'],
+                'net_sent_bytes_per_sec': snapshot['net_sent_bytes_per_sec'],
+                'net_recv_bytes_per_sec': snapshot['net_recv_bytes_per_sec'],
             }
             self.print_json(load_info, '미션 컴퓨터 실시간 부하')
             return load_info
@@ -145,41 +1477,15 @@ class MissionComputer:
             return {}
 
     def load_settings(self):
-        """setting.txt에서 출력 항목 설정 로드"""
-        settings = {
-            'operating_system': True,
-            'os_version': True,
-            'cpu_type': True,
-            'cpu_cores': True,
-            'memory_size_mb': True,
-            'cpu_usage_percent': True,
-            'memory_usage_percent': True,
-        }
-        try:
-            with open('setting.txt', 'r') as f:
-                for line in f:
-                    key, value = line.strip().split('=')
-                    settings[key] = value.lower() == 'true'
-        except FileNotFoundError:
-            print('setting.txt 파일이 없습니다. 기본 설정을 사용합니다.')
-        except Exception as e:
-            print(f'setting.txt 로드 중 오류 발생: {e}')
-        return settings
+        """setting.txt에서 출력 항목 설정 로드 (파일이 바뀌었을 때만 다시 읽음)"""
+        return self.settings.get()
 
     def get_filtered_info(self):
         """설정에 따라 필터링된 정보 출력"""
-        settings = self.load_settings()
         try:
-            filtered_info = {}
             system_info = self.get_mission_computer_info()
             load_info = self.get_mission_computer_load()
-
-            for key in system_info:
-                if settings.get(key, False):
-                    filtered_info[key] = system_info[key]
-            for key in load_info:
-                if settings.get(key, False):
-                    filtered_info[key] = load_info[key]
+            filtered_info = self.settings.filter(system_info, load_info)
 
             if filtered_info:
                 self.print_json(filtered_info, '필터링된 미션 컴퓨터 정보')
@@ -187,6 +1493,7 @@ class MissionComputer:
             print(f'필터링된 정보를 가져오는 중 오류 발생: {e}')
 
 if __name__ == '__main__':
+    signal.signal(signal.SIGTERM, exit_on_sigterm)
     run_computer = MissionComputer()
     run_computer.get_mission_computer_info()
     run_computer.get_mission_computer_load()
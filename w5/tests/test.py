@@ -0,0 +1,478 @@
+import asyncio
+import io
+import json
+import math
+import os
+import random
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from mars_mission_computer import (  # noqa: E402
+    FixedRateTicker,
+    LazyModule,
+    LogSink,
+    RollingStats,
+    SampleSerializer,
+    SENSOR_RANGES,
+    SensorScheduler,
+    TelemetryReader,
+    TelemetryWriter,
+    WindowStats,
+    convert_text_log,
+)
+
+STARTUP_BUDGET_US = 50000  # 모듈 import 에 허용하는 시간(마이크로초)
+LAZY_MODULES = ('asyncio', 'json', 'platform', 'psutil', 're')
+
+
+class FakeClock:
+    """sleep() 하면 시간이 그만큼 바로 흐르는 가상 시계"""
+    def __init__(self):
+        self.now = 1000.0
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def work(self, seconds):
+        self.now += seconds
+
+
+class SimulatedSensor:
+    """set_env() 가 호출될 때마다 값이 1씩 늘어나는 테스트용 센서"""
+    def __init__(self):
+        self.env_values = {'value': 0}
+
+    def set_env(self):
+        self.env_values['value'] += 1
+
+
+class SensorSchedulerTest(unittest.TestCase):
+    def test_many_sensors_at_thousands_of_samples_per_second(self):
+        sensor_count = 20
+        period = 0.01  # 센서당 100Hz, 전체 2000 samples/s
+        duration = 1.0
+        scheduler = SensorScheduler()
+        sensors = [SimulatedSensor() for _ in range(sensor_count)]
+        for i, sensor in enumerate(sensors):
+            scheduler.add_sensor(f'sensor{i}', sensor, period)
+        readings = []
+        scheduler.add_handler(readings.append)
+
+        asyncio.run(scheduler.run(duration))
+
+        expected = sensor_count * duration / period
+        self.assertGreaterEqual(scheduler.sample_count, expected * 0.9)
+        self.assertEqual(scheduler.dropped_count, 0)
+        # 핸들러는 큐에 들어간 모든 측정값을 받음
+        self.assertEqual(len(readings), scheduler.sample_count)
+
+        for i in range(sensor_count):
+            own = [r for r in readings if r.name == f'sensor{i}']
+            # 센서별 측정값은 순서대로, 하나도 빠짐없이 전달됨
+            self.assertEqual([r.values['value'] for r in own], list(range(1, len(own) + 1)))
+            # n 번째 측정 시각은 n * 주기 근처에 머물러야 함 (누적 지연 없음)
+            last = own[-1]
+            self.assertLess(abs(last.timestamp - last.tick * period), 0.05)
+
+
+class FixedRateTickerTest(unittest.TestCase):
+    def test_no_drift_over_simulated_day(self):
+        period = 5
+        fake = FakeClock()
+        ticker = FixedRateTicker(period, clock=fake.clock, sleep=fake.sleep)
+        rng = random.Random(0)
+        start = fake.now
+        ticks_per_day = 24 * 3600 // period
+        for expected_tick in range(ticks_per_day):
+            tick = ticker.wait()
+            self.assertEqual(tick, expected_tick)
+            # 깨어난 시각이 절대 마감 시각과 일치해야 함
+            self.assertAlmostEqual(fake.now, start + tick * period, places=6)
+            fake.work(rng.uniform(0, period * 0.9))
+
+        metrics = ticker.metrics()
+        self.assertEqual(metrics['ticks'], ticks_per_day)
+        self.assertEqual(metrics['overruns'], 0)
+        self.assertEqual(metrics['skipped_ticks'], 0)
+        self.assertLess(metrics['jitter_max'], 1e-6)
+
+    def test_overruns_and_skipped_ticks_over_simulated_hours(self):
+        period = 0.1
+        fake = FakeClock()
+        ticker = FixedRateTicker(period, clock=fake.clock, sleep=fake.sleep)
+        rng = random.Random(1)
+        start = fake.now
+        expected_overruns = 0
+        expected_skipped = 0
+        last_tick = -1
+        hours = 10
+        while fake.now - start < hours * 3600:
+            tick = ticker.wait()
+            self.assertGreater(tick, last_tick)
+            last_tick = tick
+            # 틱은 항상 자기 마감 시각 이후, 한 주기 안에 실행됨
+            lateness = fake.now - (start + tick * period)
+            self.assertGreaterEqual(lateness, -1e-6)
+            self.assertLess(lateness, period)
+
+            # 가끔 주기보다 오래 걸리는 작업을 섞음
+            if rng.random() < 0.01:
+                work = period * rng.uniform(1.1, 4.5)
+            else:
+                work = period * rng.uniform(0, 0.8)
+            next_deadline = start + (tick + 1) * period
+            finish = fake.now + work
+            if finish > next_deadline:
+                expected_overruns += 1
+                expected_skipped += int((finish - next_deadline) // period)
+            fake.work(work)
+
+        metrics = ticker.metrics()
+        self.assertEqual(metrics['overruns'], expected_overruns)
+        self.assertEqual(metrics['skipped_ticks'], expected_skipped)
+        # 실행한 틱과 건너뛴 틱을 합하면 흐른 시간과 맞아야 함
+        self.assertEqual(metrics['ticks'] + metrics['skipped_ticks'], last_tick + 1)
+
+
+
+class LogSinkTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, 'log.txt')
+
+    def read(self):
+        with open(self.path) as file:
+            return file.read()
+
+    def test_idle_write_is_flushed_by_timer(self):
+        sink = LogSink(self.path, flush_interval=0.05)
+        self.addCleanup(sink.close)
+        sink.write('first\n')
+        deadline = time.monotonic() + 2
+        while not os.path.exists(self.path) or not self.read():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+        self.assertEqual(self.read(), 'first\n')
+
+    def test_shared_sink_per_path(self):
+        sink = LogSink.for_path(self.path)
+        self.addCleanup(sink.close)
+        self.assertIs(LogSink.for_path(os.path.join(self.temp_dir.name, '.', 'log.txt')), sink)
+        self.assertIsNot(LogSink.for_path(self.path + '2'), sink)
+
+    def test_close_then_write_again(self):
+        sink = LogSink(self.path)
+        sink.write('a\n')
+        sink.close()
+        sink.write('b\n')
+        sink.close()
+        self.assertEqual(self.read(), 'a\nb\n')
+
+
+def unpack_msgpack(data, offset=0):
+    """SampleSerializer 가 쓰는 msgpack 부분 집합만 읽는 시험용 디코더, (값, 다음 위치) 반환"""
+    tag = data[offset]
+    offset += 1
+    if tag < 0x80:
+        return tag, offset
+    if 0x80 <= tag <= 0x8f or tag == 0xde:
+        if tag == 0xde:
+            size, offset = struct.unpack_from('>H', data, offset)[0], offset + 2
+        else:
+            size = tag & 0x0f
+        result = {}
+        for _ in range(size):
+            key, offset = unpack_msgpack(data, offset)
+            result[key], offset = unpack_msgpack(data, offset)
+        return result, offset
+    if 0xa0 <= tag <= 0xbf or tag in (0xd9, 0xda, 0xdb):
+        if tag == 0xd9:
+            size, offset = data[offset], offset + 1
+        elif tag == 0xda:
+            size, offset = struct.unpack_from('>H', data, offset)[0], offset + 2
+        elif tag == 0xdb:
+            size, offset = struct.unpack_from('>I', data, offset)[0], offset + 4
+        else:
+            size = tag & 0x1f
+        return data[offset:offset + size].decode('utf-8'), offset + size
+    if tag == 0xcb:
+        return struct.unpack_from('>d', data, offset)[0], offset + 8
+    if tag == 0xd3:
+        return struct.unpack_from('>q', data, offset)[0], offset + 8
+    return {0xc0: None, 0xc2: False, 0xc3: True}[tag], offset
+
+
+class SampleSerializerTest(unittest.TestCase):
+    SAMPLE = {'temperature': 21.456, 'humidity': 55.0}
+    MIXED = {
+        'quote"key': 'say "hi"\\ \n 한글',
+        '{braces}': 1.5,
+        'nan': float('nan'),
+        'inf': float('-inf'),
+        'count': 3,
+        'flag': True,
+        'none': None,
+    }
+
+    def serialize(self, output_format, records):
+        stream = io.BytesIO()
+        serializer = SampleSerializer(output_format, stream)
+        for data, title in records:
+            serializer.write(data, title)
+        serializer.close()
+        return stream.getvalue()
+
+    def test_ndjson_lines_are_valid_json(self):
+        output = self.serialize('ndjson', [
+            (self.SAMPLE, ''),
+            (self.SAMPLE, '현재 "환경" 데이터'),
+            (self.MIXED, ''),
+            ({'{braces}': 2.0}, 'T+5 sec'),
+        ])
+        lines = [json.loads(line) for line in output.decode('utf-8').splitlines()]
+        self.assertEqual(lines[0], {'temperature': 21.46, 'humidity': 55.0})
+        self.assertEqual(lines[1], {'title': '현재 "환경" 데이터', 'data': lines[0]})
+        self.assertEqual(lines[2], {
+            'quote"key': 'say "hi"\\ \n 한글',
+            '{braces}': 1.5,
+            'nan': None,
+            'inf': None,
+            'count': 3,
+            'flag': True,
+            'none': None,
+        })
+        self.assertEqual(lines[3], {'title': 'T+5 sec', 'data': {'{braces}': 2.0}})
+
+    def test_ndjson_template_falls_back_for_non_finite_values(self):
+        output = self.serialize('ndjson', [(self.SAMPLE, ''), ({'temperature': math.nan, 'humidity': 1.0}, '')])
+        lines = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(lines[1], {'temperature': None, 'humidity': 1.0})
+
+    def test_msgpack_records_decode(self):
+        many = {f'key{i}': float(i) for i in range(20)}
+        long_title = 't' * 300
+        output = self.serialize('msgpack', [
+            (self.SAMPLE, ''),
+            (self.SAMPLE, '제목'),
+            (self.MIXED, ''),
+            (many, long_title),
+            ({'n': -5, 'big': 2 ** 40}, ''),
+        ])
+        records = []
+        offset = 0
+        while offset < len(output):
+            record, offset = unpack_msgpack(output, offset)
+            records.append(record)
+        self.assertEqual(records[0], self.SAMPLE)
+        self.assertEqual(records[1], {'title': '제목', 'data': self.SAMPLE})
+        mixed = dict(records[2])
+        self.assertTrue(math.isnan(mixed.pop('nan')))
+        expected = dict(self.MIXED)
+        del expected['nan']
+        self.assertEqual(mixed, expected)
+        self.assertEqual(records[3], {'title': long_title, 'data': many})
+        self.assertEqual(records[4], {'n': -5, 'big': 2 ** 40})
+
+    def test_idle_record_is_flushed_by_timer(self):
+        stream = io.BytesIO()
+        serializer = SampleSerializer('ndjson', stream, flush_interval=0.05)
+        self.addCleanup(serializer.close)
+        serializer.write(self.SAMPLE)
+        deadline = time.monotonic() + 2
+        while not stream.getvalue():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+        self.assertEqual(json.loads(stream.getvalue()), {'temperature': 21.46, 'humidity': 55.0})
+
+
+class RollingStatsTest(unittest.TestCase):
+    def assert_matches_statistics(self, stats, values):
+        self.assertEqual(len(stats), len(values))
+        self.assertAlmostEqual(stats.mean(), statistics.fmean(values))
+        self.assertAlmostEqual(stats.variance(), statistics.pvariance(values))
+        self.assertEqual(stats.min(), min(values))
+        self.assertEqual(stats.max(), max(values))
+        self.assertAlmostEqual(stats.percentile(50), statistics.median(values))
+        if len(values) > 1:
+            p95 = statistics.quantiles(values, n=100, method='inclusive')[94]
+            self.assertAlmostEqual(stats.percentile(95), p95)
+        else:
+            self.assertEqual(stats.percentile(95), values[0])
+        summary = stats.summary()
+        self.assertAlmostEqual(summary['p50'], stats.percentile(50))
+        self.assertAlmostEqual(summary['p95'], stats.percentile(95))
+
+    def check_windows(self, make_value, **ranges):
+        rng = random.Random(0)
+        for window, count in [(1, 1), (1, 10), (8, 5), (8, 8), (7, 100)]:
+            with self.subTest(window=window, count=count):
+                stats = RollingStats(window, **ranges)
+                values = [make_value(rng) for _ in range(count)]
+                for value in values:
+                    stats.add(value)
+                self.assert_matches_statistics(stats, values[-window:])
+
+    def test_sorted_percentiles_without_range(self):
+        self.check_windows(lambda rng: rng.uniform(-5, 5))
+
+    def test_histogram_percentiles_on_grid(self):
+        self.check_windows(lambda rng: rng.randint(1800, 3000) / 100, low=18, high=30)
+
+    def test_histogram_falls_back_for_off_grid_values(self):
+        def make_value(rng):
+            # 범위 밖의 값과 0.01 격자에 없는 값을 섞음
+            return rng.choice([rng.randint(1800, 3000) / 100, rng.uniform(0, 40)])
+        self.check_windows(make_value, low=18, high=30)
+
+    def test_window_stats(self):
+        rng = random.Random(1)
+        ranges = {'a': (0, 10)}
+        window = WindowStats(['a', 'b'], 5, ranges)
+        samples = [{'a': rng.randint(0, 1000) / 100, 'b': rng.random()} for _ in range(12)]
+        for sample in samples:
+            window.add(sample)
+        self.assertEqual(len(window), 5)
+        for key in ('a', 'b'):
+            values = [sample[key] for sample in samples[-5:]]
+            self.assertAlmostEqual(window.means()[key], statistics.fmean(values))
+            self.assertAlmostEqual(window.summary()[key]['p50'], statistics.median(values))
+
+
+class TelemetryTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def write_rows(self, path, count, sync_interval=7):
+        rng = random.Random(2)
+        grids = [range(round(low * 100), round(high * 100) + 1) for low, high in SENSOR_RANGES.values()]
+        rows = [(i * 5.0, *(rng.choice(grid) / 100 for grid in grids)) for i in range(count)]
+        with TelemetryWriter(path, typecode='d', sync_interval=sync_interval) as writer:
+            writer.write_rows(rows)
+        return rows
+
+    def test_round_trip_and_range_scan(self):
+        path = self.path('telemetry.bin')
+        rows = self.write_rows(path, 30)
+        with TelemetryReader(path) as reader:
+            self.assertEqual(reader.fields, tuple(SENSOR_RANGES))
+            self.assertEqual(len(reader), 30)
+            self.assertEqual(list(reader.records()), rows)
+            self.assertEqual(reader.record(17), rows[17])
+            self.assertEqual(list(reader.records(5, 16)), rows[5:16])
+            self.assertEqual(reader.find_range(12, 40), (3, 8))
+            self.assertEqual(list(reader.iter_range(12, 40)), rows[3:8])
+            self.assertEqual(reader.find_range(1000), (30, 30))
+
+    def test_close_with_suspended_generators(self):
+        path = self.path('telemetry.bin')
+        rows = self.write_rows(path, 30)
+        with TelemetryReader(path) as reader:
+            records = reader.records()
+            in_range = reader.iter_range(12, 40)
+            self.assertEqual(next(records), rows[0])
+            self.assertEqual(next(in_range), rows[3])
+
+    def test_float32_values(self):
+        path = self.path('telemetry32.bin')
+        with TelemetryWriter(path) as writer:
+            writer.write(1.0, {key: 1.25 for key in SENSOR_RANGES})
+        with TelemetryReader(path) as reader:
+            self.assertEqual(reader.record(0), (1.0,) + (1.25,) * len(SENSOR_RANGES))
+
+    def test_truncated_tail_is_ignored(self):
+        path = self.path('telemetry.bin')
+        rows = self.write_rows(path, 30)
+        with open(path, 'rb') as file:
+            data = file.read()
+        with open(path, 'wb') as file:
+            file.write(data[:-10])
+        with TelemetryReader(path) as reader:
+            self.assertEqual(len(reader), 29)
+            self.assertEqual(list(reader.records()), rows[:29])
+
+    def test_broken_sync_marker_is_detected(self):
+        path = self.path('telemetry.bin')
+        self.write_rows(path, 30)
+        with TelemetryReader(path) as reader:
+            offset = reader._offset(14) - 16  # 14 번 레코드 앞의 동기화 표식
+        with open(path, 'r+b') as file:
+            file.seek(offset)
+            file.write(b'X')
+        with TelemetryReader(path) as reader:
+            self.assertEqual(len(list(reader.records(0, 14))), 14)
+            with self.assertRaises(ValueError):
+                list(reader.records())
+
+    def test_convert_cp949_log_with_malformed_entry(self):
+        entry = (
+            '[{}]\n내부 온도: {}\n외부 온도: 1.00\n내부 습도: 50.00\n'
+            '외부 광량: 600.00\n내부 CO2: 0.05\n내부 산소: 5.00\n\n'
+        )
+        text = (
+            entry.format('T+0 sec', '20.50')
+            + entry.format('T+5 sec', '??')
+            + entry.format('센서 T+7.5 sec', '21.25')
+        )
+        text_path = self.path('log.txt')
+        with open(text_path, 'w', encoding='cp949') as file:
+            file.write(text)
+        binary_path = self.path('log.bin')
+        self.assertEqual(convert_text_log(text_path, binary_path, typecode='d'), 2)
+        with TelemetryReader(binary_path) as reader:
+            self.assertEqual([record[:2] for record in reader.records()], [(0.0, 20.5), (7.5, 21.25)])
+        self.assertFalse(os.path.exists(binary_path + '.tmp'))
+
+
+def import_times():
+    """python -X importtime 으로 모듈을 새로 불러올 때 모듈별 누적 import 시간(마이크로초)"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # 바이트코드 캐시가 있는 평소 시작 조건에서 측정
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import mars_mission_computer'],
+        cwd=SRC_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class StartupTest(unittest.TestCase):
+    def test_heavy_modules_are_not_imported_at_startup(self):
+        times = import_times()
+        for name in LAZY_MODULES:
+            self.assertNotIn(name, times)
+
+    def test_import_time_within_budget(self):
+        import_times()  # 첫 실행은 바이트코드 캐시를 만드는 데 씀
+        best = min(import_times()['mars_mission_computer'] for _ in range(3))
+        self.assertLess(best, STARTUP_BUDGET_US)
+
+    def test_lazy_module_loads_on_first_use(self):
+        namespace = {}
+        namespace['colorsys'] = LazyModule('colorsys', namespace)
+        self.assertEqual(namespace['colorsys'].rgb_to_hsv(1, 0, 0), (0.0, 1.0, 1.0))
+        self.assertIs(namespace['colorsys'], sys.modules['colorsys'])
+
+
+if __name__ == '__main__':
+    unittest.main()